@@ -2,133 +2,41 @@
 Documentation generator module - creates compliant documentation.
 """
 
+import asyncio
+import hashlib
 import os
+from collections import OrderedDict
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-from anthropic import Anthropic, APIError, APIConnectionError, RateLimitError
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Tuple, Union
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from docugen.utils.config import DetailLevel
 
+if TYPE_CHECKING:
+    import anthropic
 
-class DocGeneratorError(Exception):
-    """Base exception for documentation generator errors."""
-    pass
+# Client classes, imported from anthropic on first use so that importing this
+# module stays cheap. Module attributes so tests can patch them.
+Anthropic = None
+AsyncAnthropic = None
 
 
-class APIKeyMissingError(DocGeneratorError):
-    """Raised when API key is not provided or found."""
-    pass
-
+# File extension -> language, with common uppercase spellings so most
+# lookups avoid lowercasing the suffix
+_SUPPORTED_EXTENSIONS = ('.sql', '.py', '.r')
+_EXT_TO_LANG = {
+    '.sql': 'sql',
+    '.py': 'python',
+    '.r': 'r',
+    '.SQL': 'sql',
+    '.PY': 'python',
+    '.R': 'r',
+}
 
-class DocGenerator:
-    """
-    Generates documentation using LLM (Claude).
-
-    This class interfaces with Anthropic's Claude API to generate
-    standards-compliant documentation for SQL, Python, and R code files.
-
-    Parameters
-    ----------
-    api_key : str, optional
-        Anthropic API key. If not provided, will attempt to read from
-        ANTHROPIC_API_KEY environment variable.
-
-    Raises
-    ------
-    APIKeyMissingError
-        If no API key is provided and ANTHROPIC_API_KEY env var is not set.
-
-    Examples
-    --------
-    >>> generator = DocGenerator()
-    >>> docs = generator.generate(Path("script.py"), code_content)
-    """
-
-    def __init__(self, api_key: Optional[str] = None, custom_prompt_suffix: Optional[str] = None):
-        """
-        Initialize generator with Claude API.
-
-        Parameters
-        ----------
-        api_key : str, optional
-            Anthropic API key. If None, reads from ANTHROPIC_API_KEY env var.
-        custom_prompt_suffix : str, optional
-            Additional instructions to append to all prompts.
-
-        Raises
-        ------
-        APIKeyMissingError
-            If no API key is available.
-        """
-        self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        self.custom_prompt_suffix = custom_prompt_suffix
-
-        if not self.api_key:
-            raise APIKeyMissingError(
-                "Anthropic API key not found. Please set the ANTHROPIC_API_KEY "
-                "environment variable or pass api_key parameter.\n\n"
-                "Example: export ANTHROPIC_API_KEY='your-api-key-here'"
-            )
-
-        try:
-            self.client = Anthropic(api_key=self.api_key)
-        except Exception as e:
-            raise DocGeneratorError(f"Failed to initialize Anthropic client: {e}")
-
-        self.console = Console()
-        self.model = "claude-3-5-sonnet-20241022"
-
-    def _get_file_language(self, file_path: Path) -> str:
-        """
-        Determine language from file extension.
-
-        Parameters
-        ----------
-        file_path : Path
-            Path to the file.
-
-        Returns
-        -------
-        str
-            Language identifier ('sql', 'python', or 'r').
-
-        Raises
-        ------
-        DocGeneratorError
-            If file extension is not supported.
-        """
-        suffix = file_path.suffix.lower()
-        mapping = {
-            '.sql': 'sql',
-            '.py': 'python',
-            '.r': 'r'
-        }
-
-        if suffix not in mapping:
-            raise DocGeneratorError(
-                f"Unsupported file extension: {suffix}. "
-                f"Supported: {', '.join(mapping.keys())}"
-            )
-
-        return mapping[suffix]
-
-    def _get_sql_prompt(self, detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
-        """
-        Get prompt template for SQL documentation generation.
-
-        Parameters
-        ----------
-        detail_level : DetailLevel
-            Level of documentation detail (minimal, concise, or verbose).
-
-        Returns
-        -------
-        str
-            Prompt template for SQL markdown-style comments.
-        """
-        if detail_level == DetailLevel.MINIMAL:
-            return """You are a technical documentation expert specializing in SQL.
+# Prompt templates per language and detail level, built once at import time
+_SQL_PROMPT_MINIMAL = """You are a technical documentation expert specializing in SQL.
 
 Generate MINIMAL, brief documentation comments for the SQL code provided.
 
@@ -149,8 +57,7 @@ CODE TO DOCUMENT:
 
 Return ONLY the minimal documentation comments (starting with --), ready to be inserted directly before the code."""
 
-        elif detail_level == DetailLevel.VERBOSE:
-            return """You are a technical documentation expert specializing in SQL.
+_SQL_PROMPT_VERBOSE = """You are a technical documentation expert specializing in SQL.
 
 Generate COMPREHENSIVE, detailed documentation comments for the SQL code provided.
 
@@ -207,8 +114,7 @@ CODE TO DOCUMENT:
 
 Return ONLY the comprehensive documentation comments (starting with --), ready to be inserted directly before the code."""
 
-        else:  # CONCISE (default)
-            return """You are a technical documentation expert specializing in SQL.
+_SQL_PROMPT_CONCISE = """You are a technical documentation expert specializing in SQL.
 
 Generate concise, balanced documentation comments for the SQL code provided.
 
@@ -249,22 +155,13 @@ CODE TO DOCUMENT:
 
 Return ONLY the documentation comments (starting with --), ready to be inserted directly before the code."""
 
-    def _get_python_prompt(self, detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
-        """
-        Get prompt template for Python documentation generation.
-
-        Parameters
-        ----------
-        detail_level : DetailLevel
-            Level of documentation detail (minimal, concise, or verbose).
+_SQL_PROMPTS = {
+    DetailLevel.MINIMAL: _SQL_PROMPT_MINIMAL,
+    DetailLevel.CONCISE: _SQL_PROMPT_CONCISE,
+    DetailLevel.VERBOSE: _SQL_PROMPT_VERBOSE,
+}
 
-        Returns
-        -------
-        str
-            Prompt template for NumPy-style docstrings.
-        """
-        if detail_level == DetailLevel.MINIMAL:
-            return '''You are a technical documentation expert specializing in Python.
+_PYTHON_PROMPT_MINIMAL = '''You are a technical documentation expert specializing in Python.
 
 Generate MINIMAL, brief docstrings for the Python code provided.
 
@@ -284,8 +181,7 @@ CODE TO DOCUMENT:
 
 Return ONLY the minimal docstring content (the text between the triple quotes), ready to be placed as a function/class docstring.'''
 
-        elif detail_level == DetailLevel.VERBOSE:
-            return '''You are a technical documentation expert specializing in Python.
+_PYTHON_PROMPT_VERBOSE = '''You are a technical documentation expert specializing in Python.
 
 Generate COMPREHENSIVE, detailed NumPy/SciPy-style docstrings for the Python code provided.
 
@@ -368,8 +264,7 @@ CODE TO DOCUMENT:
 
 Return ONLY the comprehensive docstring content (the text between the triple quotes, including proper formatting), ready to be placed as a function/class docstring.'''
 
-        else:  # CONCISE (default)
-            return '''You are a technical documentation expert specializing in Python.
+_PYTHON_PROMPT_CONCISE = '''You are a technical documentation expert specializing in Python.
 
 Generate concise, balanced NumPy/SciPy-style docstrings for the Python code provided.
 
@@ -422,22 +317,13 @@ CODE TO DOCUMENT:
 
 Return ONLY the docstring text content (without triple quotes), ready to be placed inside triple quotes as a function/class docstring.'''
 
-    def _get_r_prompt(self, detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
-        """
-        Get prompt template for R documentation generation.
-
-        Parameters
-        ----------
-        detail_level : DetailLevel
-            Level of documentation detail (minimal, concise, or verbose).
+_PYTHON_PROMPTS = {
+    DetailLevel.MINIMAL: _PYTHON_PROMPT_MINIMAL,
+    DetailLevel.CONCISE: _PYTHON_PROMPT_CONCISE,
+    DetailLevel.VERBOSE: _PYTHON_PROMPT_VERBOSE,
+}
 
-        Returns
-        -------
-        str
-            Prompt template for Roxygen2-style documentation.
-        """
-        if detail_level == DetailLevel.MINIMAL:
-            return """You are a technical documentation expert specializing in R.
+_R_PROMPT_MINIMAL = """You are a technical documentation expert specializing in R.
 
 Generate MINIMAL, brief Roxygen2 documentation for the R code provided.
 
@@ -456,8 +342,7 @@ CODE TO DOCUMENT:
 
 Return ONLY the minimal Roxygen2 comments (starting with #'), ready to be inserted directly before the function definition."""
 
-        elif detail_level == DetailLevel.VERBOSE:
-            return """You are a technical documentation expert specializing in R.
+_R_PROMPT_VERBOSE = """You are a technical documentation expert specializing in R.
 
 Generate COMPREHENSIVE, detailed Roxygen2 documentation for the R code provided.
 
@@ -518,8 +403,7 @@ CODE TO DOCUMENT:
 
 Return ONLY the comprehensive Roxygen2 comments (starting with #'), ready to be inserted directly before the function definition."""
 
-        else:  # CONCISE (default)
-            return """You are a technical documentation expert specializing in R.
+_R_PROMPT_CONCISE = """You are a technical documentation expert specializing in R.
 
 Generate concise, balanced Roxygen2 documentation for the R code provided.
 
@@ -559,11 +443,412 @@ CODE TO DOCUMENT:
 
 Return ONLY the Roxygen2 comments (starting with #'), ready to be inserted directly before the function definition."""
 
+_R_PROMPTS = {
+    DetailLevel.MINIMAL: _R_PROMPT_MINIMAL,
+    DetailLevel.CONCISE: _R_PROMPT_CONCISE,
+    DetailLevel.VERBOSE: _R_PROMPT_VERBOSE,
+}
+
+
+def _split_prompt(template: str) -> Tuple[str, str]:
+    """
+    Split a prompt template around its {code} placeholder.
+
+    Parameters
+    ----------
+    template : str
+        Prompt template containing exactly one {code} placeholder.
+
+    Returns
+    -------
+    Tuple[str, str]
+        Text before and after the placeholder.
+    """
+    prefix, suffix = template.split('{code}', 1)
+    return prefix, suffix
+
+
+# Prefix/suffix pairs for every built-in template, split once at import time.
+# Substituting by concatenation also leaves other literal braces in the
+# templates (e.g. Roxygen2's \code{\link{...}}) untouched.
+_PROMPT_PARTS = {
+    template: _split_prompt(template)
+    for prompts in (_SQL_PROMPTS, _PYTHON_PROMPTS, _R_PROMPTS)
+    for template in prompts.values()
+}
+
+
+def _prompt_parts(template: str) -> Tuple[str, str]:
+    """
+    Get the text before and after a prompt template's {code} placeholder.
+
+    Parameters
+    ----------
+    template : str
+        Prompt template containing a {code} placeholder.
+
+    Returns
+    -------
+    Tuple[str, str]
+        Static prefix and suffix surrounding the code.
+    """
+    parts = _PROMPT_PARTS.get(template)
+    if parts is None:
+        parts = _split_prompt(template)
+    return parts
+
+
+@lru_cache(maxsize=None)
+def _update_prefix(template: str) -> str:
+    """
+    Build the static part of an update prompt from a generate template.
+
+    Parameters
+    ----------
+    template : str
+        Generate prompt template whose REQUIREMENTS section is reused.
+
+    Returns
+    -------
+    str
+        Update prompt text preceding the existing documentation and code.
+    """
+    requirements = template.split('REQUIREMENTS:')[1].split('CODE TO DOCUMENT:')[0]
+    return f"""You are a technical documentation expert.
+
+TASK: Fix and improve the existing documentation to meet the required standards.
+
+REQUIREMENTS:
+{requirements}
+
+INSTRUCTIONS:
+1. Review the existing documentation
+2. Fix any issues with format, structure, or accuracy
+3. Ensure it matches the required standard exactly
+4. Keep good parts of the existing documentation
+5. Add missing sections (parameters, returns, examples, etc.)
+6. Make sure examples are realistic and correct
+
+"""
+
+
+def _prompt_content(prefix: str, rest: str) -> List[Dict[str, Any]]:
+    """
+    Build message content with the static prompt prefix marked cacheable.
+
+    Parameters
+    ----------
+    prefix : str
+        Prompt text that is identical across requests for a language and
+        detail level.
+    rest : str
+        Request-specific remainder of the prompt.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Text content blocks for a messages API user turn.
+    """
+    return [
+        {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": rest},
+    ]
+
+
+class ErrorCode(IntEnum):
+    """
+    Failure category attached to a DocGeneratorError.
+
+    Attributes
+    ----------
+    UNEXPECTED : int
+        Any failure not covered by a more specific code.
+    API_ERROR : int
+        The API returned an error response.
+    RATE_LIMIT : int
+        The API rate limit was exceeded.
+    CONNECTION : int
+        The API could not be reached.
+    UNSUPPORTED_FILE : int
+        The file extension is not a supported language.
+    """
+
+    UNEXPECTED = 0
+    API_ERROR = 1
+    RATE_LIMIT = 2
+    CONNECTION = 3
+    UNSUPPORTED_FILE = 4
+
+
+class DocGeneratorError(Exception):
+    """
+    Base exception for documentation generator errors.
+
+    Parameters
+    ----------
+    message : str
+        Human-readable description of the failure.
+    code : ErrorCode, optional
+        Failure category. Default is ErrorCode.UNEXPECTED.
+    """
+
+    def __init__(self, message: str = "", code: ErrorCode = ErrorCode.UNEXPECTED):
+        super().__init__(message)
+        self.code = code
+
+
+class APIKeyMissingError(DocGeneratorError):
+    """Raised when API key is not provided or found."""
+    pass
+
+
+def _api_error(error: Exception, action: str) -> DocGeneratorError:
+    """
+    Translate an exception raised while calling the API.
+
+    Parameters
+    ----------
+    error : Exception
+        Exception raised by the Anthropic client.
+    action : str
+        What was being done, used in the fallback message
+        (e.g. "documentation generation").
+
+    Returns
+    -------
+    DocGeneratorError
+        Error with a user-facing message for the failure.
+    """
+    from anthropic import APIError, APIConnectionError, RateLimitError
+
+    if isinstance(error, RateLimitError):
+        return DocGeneratorError(
+            f"API rate limit exceeded. Please wait and try again.\n"
+            f"Details: {error}",
+            ErrorCode.RATE_LIMIT
+        )
+    if isinstance(error, APIConnectionError):
+        return DocGeneratorError(
+            f"Failed to connect to Anthropic API. Check your internet connection.\n"
+            f"Details: {error}",
+            ErrorCode.CONNECTION
+        )
+    if isinstance(error, APIError):
+        return DocGeneratorError(f"API error occurred: {error}", ErrorCode.API_ERROR)
+    return DocGeneratorError(f"Unexpected error during {action}: {error}")
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> "anthropic.Anthropic":
+    """
+    Get a shared Anthropic client for an API key.
+
+    Generators using the same key share one client and therefore one HTTP
+    connection pool.
+
+    Parameters
+    ----------
+    api_key : str
+        Anthropic API key.
+
+    Returns
+    -------
+    Anthropic
+        Client for the key, created on first request.
+    """
+    global Anthropic
+    if Anthropic is None:
+        from anthropic import Anthropic
+    return Anthropic(api_key=api_key)
+
+
+class DocGenerator:
+    """
+    Generates documentation using LLM (Claude).
+
+    This class interfaces with Anthropic's Claude API to generate
+    standards-compliant documentation for SQL, Python, and R code files.
+
+    Parameters
+    ----------
+    api_key : str, optional
+        Anthropic API key. If not provided, will attempt to read from
+        ANTHROPIC_API_KEY environment variable.
+
+    Raises
+    ------
+    APIKeyMissingError
+        If no API key is provided and ANTHROPIC_API_KEY env var is not set.
+
+    Examples
+    --------
+    >>> generator = DocGenerator()
+    >>> docs = generator.generate(Path("script.py"), code_content)
+    """
+
+    # Most generate() results kept before the least recently used is evicted
+    CACHE_SIZE = 512
+
+    def __init__(self, api_key: Optional[str] = None, custom_prompt_suffix: Optional[str] = None,
+                 async_client: Optional["anthropic.AsyncAnthropic"] = None, stream: bool = False):
+        """
+        Initialize generator with Claude API.
+
+        Parameters
+        ----------
+        api_key : str, optional
+            Anthropic API key. If None, reads from ANTHROPIC_API_KEY env var.
+        custom_prompt_suffix : str, optional
+            Additional instructions to append to all prompts.
+        async_client : AsyncAnthropic, optional
+            Client used by agenerate() and abatch(). Created on first use
+            if not given.
+        stream : bool, optional
+            If True, generate() and update() receive the response as a
+            stream of text deltas instead of one buffered message, which
+            avoids HTTP timeouts on long completions. Default is False.
+
+        Raises
+        ------
+        APIKeyMissingError
+            If no API key is available.
+        """
+        self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        self.custom_prompt_suffix = custom_prompt_suffix
+        self.stream = stream
+
+        if not self.api_key:
+            raise APIKeyMissingError(
+                "Anthropic API key not found. Please set the ANTHROPIC_API_KEY "
+                "environment variable or pass api_key parameter.\n\n"
+                "Example: export ANTHROPIC_API_KEY='your-api-key-here'"
+            )
+
+        try:
+            self.client = _get_client(self.api_key)
+        except Exception as e:
+            raise DocGeneratorError(f"Failed to initialize Anthropic client: {e}")
+
+        self.console = Console()
+        self.model = "claude-3-5-sonnet-20241022"
+
+        self._async_client = async_client
+
+        # Prompt template getter per language
+        self._prompt_getters = {
+            'sql': self._get_sql_prompt,
+            'python': self._get_python_prompt,
+            'r': self._get_r_prompt,
+        }
+
+        # Generated docs keyed by everything that shapes the prompt, least
+        # recently used first so long batch runs stay bounded
+        self._cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+
+    @property
+    def async_client(self) -> "anthropic.AsyncAnthropic":
+        """AsyncAnthropic client, created on first access."""
+        global AsyncAnthropic
+        if self._async_client is None:
+            try:
+                if AsyncAnthropic is None:
+                    from anthropic import AsyncAnthropic
+                self._async_client = AsyncAnthropic(api_key=self.api_key)
+            except Exception as e:
+                raise DocGeneratorError(f"Failed to initialize Anthropic client: {e}")
+        return self._async_client
+
+    def clear_cache(self) -> None:
+        """Discard all cached generate() results."""
+        self._cache.clear()
+
+    def _get_file_language(self, path_or_suffix: Union[str, Path]) -> str:
+        """
+        Determine language from file extension.
+
+        Parameters
+        ----------
+        path_or_suffix : str or Path
+            Path to the file, or its extension as a string (e.g. '.sql').
+
+        Returns
+        -------
+        str
+            Language identifier ('sql', 'python', or 'r').
+
+        Raises
+        ------
+        DocGeneratorError
+            If file extension is not supported.
+        """
+        suffix = path_or_suffix if isinstance(path_or_suffix, str) else path_or_suffix.suffix
+        language = _EXT_TO_LANG.get(suffix) or _EXT_TO_LANG.get(suffix.lower())
+
+        if language is None:
+            raise DocGeneratorError(
+                f"Unsupported file extension: {suffix.lower()}. "
+                f"Supported: {', '.join(_SUPPORTED_EXTENSIONS)}",
+                ErrorCode.UNSUPPORTED_FILE
+            )
+
+        return language
+
+    def _get_sql_prompt(self, detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
+        """
+        Get prompt template for SQL documentation generation.
+
+        Parameters
+        ----------
+        detail_level : DetailLevel
+            Level of documentation detail (minimal, concise, or verbose).
+
+        Returns
+        -------
+        str
+            Prompt template for SQL markdown-style comments.
+        """
+        return _SQL_PROMPTS.get(detail_level, _SQL_PROMPT_CONCISE)
+
+    def _get_python_prompt(self, detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
+        """
+        Get prompt template for Python documentation generation.
+
+        Parameters
+        ----------
+        detail_level : DetailLevel
+            Level of documentation detail (minimal, concise, or verbose).
+
+        Returns
+        -------
+        str
+            Prompt template for NumPy-style docstrings.
+        """
+        return _PYTHON_PROMPTS.get(detail_level, _PYTHON_PROMPT_CONCISE)
+
+    def _get_r_prompt(self, detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
+        """
+        Get prompt template for R documentation generation.
+
+        Parameters
+        ----------
+        detail_level : DetailLevel
+            Level of documentation detail (minimal, concise, or verbose).
+
+        Returns
+        -------
+        str
+            Prompt template for Roxygen2-style documentation.
+        """
+        return _R_PROMPTS.get(detail_level, _R_PROMPT_CONCISE)
+
     def generate(self, file_path: Path, code_content: str,
                  detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
         """
         Generate documentation for code file.
 
+        Results are cached per language, detail level and code content, so
+        repeated calls for unchanged code do not hit the API again.
+
         Parameters
         ----------
         file_path : Path
@@ -588,21 +873,13 @@ Return ONLY the Roxygen2 comments (starting with #'), ready to be inserted direc
         RateLimitError
             If API rate limit is exceeded.
         """
-        language = self._get_file_language(file_path)
+        language = self._get_file_language(file_path.suffix)
+        cache_key = self._cache_key(language, code_content, detail_level)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-        # Get the appropriate prompt for language and detail level
-        if language == 'sql':
-            prompt_template = self._get_sql_prompt(detail_level)
-        elif language == 'python':
-            prompt_template = self._get_python_prompt(detail_level)
-        else:  # r
-            prompt_template = self._get_r_prompt(detail_level)
-
-        prompt = prompt_template.format(code=code_content)
-
-        # Append custom prompt suffix if configured
-        if self.custom_prompt_suffix:
-            prompt += f"\n\n---\nADDITIONAL INSTRUCTIONS:\n{self.custom_prompt_suffix}"
+        request = self._build_generate_request(language, code_content, detail_level)
 
         try:
             with Progress(
@@ -616,39 +893,182 @@ Return ONLY the Roxygen2 comments (starting with #'), ready to be inserted direc
                     total=None
                 )
 
-                message = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=4096,
-                    temperature=0.2,
-                    messages=[{
-                        "role": "user",
-                        "content": prompt
-                    }]
-                )
+                documentation = self._request_text(request)
 
-            # Extract text content from response
-            documentation = message.content[0].text
+            self._cache_put(cache_key, documentation)
 
-            return documentation.strip()
+            return documentation
 
-        except RateLimitError as e:
-            raise DocGeneratorError(
-                f"API rate limit exceeded. Please wait and try again.\n"
-                f"Details: {e}"
-            )
-        except APIConnectionError as e:
-            raise DocGeneratorError(
-                f"Failed to connect to Anthropic API. Check your internet connection.\n"
-                f"Details: {e}"
-            )
-        except APIError as e:
-            raise DocGeneratorError(
-                f"API error occurred: {e}"
-            )
         except Exception as e:
-            raise DocGeneratorError(
-                f"Unexpected error during documentation generation: {e}"
-            )
+            raise _api_error(e, "documentation generation")
+
+    async def agenerate(self, file_path: Path, code_content: str,
+                        detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
+        """
+        Generate documentation for code file without blocking the event loop.
+
+        Asynchronous counterpart of generate() using the AsyncAnthropic
+        client. Shares generate()'s result cache.
+
+        Parameters
+        ----------
+        file_path : Path
+            Path to the file being documented.
+        code_content : str
+            Content of the code file.
+        detail_level : DetailLevel, optional
+            Level of documentation detail (minimal, concise, or verbose).
+            Default is CONCISE.
+
+        Returns
+        -------
+        str
+            Generated documentation in appropriate format for the language.
+
+        Raises
+        ------
+        DocGeneratorError
+            If documentation generation fails or file type is unsupported.
+        """
+        language = self._get_file_language(file_path.suffix)
+        cache_key = self._cache_key(language, code_content, detail_level)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        request = self._build_generate_request(language, code_content, detail_level)
+
+        try:
+            message = await self.async_client.messages.create(**request)
+            documentation = message.content[0].text.strip()
+        except Exception as e:
+            raise _api_error(e, "documentation generation")
+
+        self._cache_put(cache_key, documentation)
+        return documentation
+
+    async def abatch(self, files: Iterable[Tuple[Path, str]],
+                     detail_level: DetailLevel = DetailLevel.CONCISE,
+                     max_concurrency: int = 5) -> List[str]:
+        """
+        Generate documentation for several files concurrently.
+
+        Parameters
+        ----------
+        files : Iterable[Tuple[Path, str]]
+            Pairs of file path and code content.
+        detail_level : DetailLevel, optional
+            Level of documentation detail applied to every file.
+            Default is CONCISE.
+        max_concurrency : int, optional
+            Maximum number of API requests in flight at once. Default is 5.
+
+        Returns
+        -------
+        List[str]
+            Generated documentation, in the same order as ``files``.
+
+        Raises
+        ------
+        DocGeneratorError
+            If generation fails for any file.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _generate_one(file_path: Path, code_content: str) -> str:
+            async with semaphore:
+                return await self.agenerate(file_path, code_content, detail_level)
+
+        return list(await asyncio.gather(
+            *(_generate_one(file_path, code) for file_path, code in files)
+        ))
+
+    def _request_text(self, request: Dict[str, Any]) -> str:
+        """
+        Send a messages request and return the response text.
+
+        Parameters
+        ----------
+        request : Dict[str, Any]
+            Keyword arguments for the messages API.
+
+        Returns
+        -------
+        str
+            Text of the first content block, or the concatenated text
+            deltas when streaming is enabled, with surrounding whitespace
+            removed.
+        """
+        if self.stream:
+            with self.client.messages.stream(**request) as stream:
+                return "".join(stream.text_stream).strip()
+
+        message = self.client.messages.create(**request)
+        return message.content[0].text.strip()
+
+    def _cache_key(self, language: str, code_content: str,
+                   detail_level: DetailLevel) -> Tuple[Any, ...]:
+        """Key generated docs by model, prompt suffix, language, detail level and code digest."""
+        return (
+            self.model,
+            self.custom_prompt_suffix,
+            language,
+            detail_level.value,
+            hashlib.blake2b(code_content.encode('utf-8'), digest_size=16).digest()
+        )
+
+    def _cache_get(self, key: Tuple[Any, ...]) -> Optional[str]:
+        """Return cached docs for key, marking them most recently used."""
+        documentation = self._cache.get(key)
+        if documentation is not None:
+            self._cache.move_to_end(key)
+        return documentation
+
+    def _cache_put(self, key: Tuple[Any, ...], documentation: str) -> None:
+        """Cache docs for key, evicting the least recently used beyond CACHE_SIZE."""
+        self._cache[key] = documentation
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _build_generate_request(self, language: str, code_content: str,
+                                detail_level: DetailLevel) -> Dict[str, Any]:
+        """
+        Build messages API arguments for a generate request.
+
+        Parameters
+        ----------
+        language : str
+            Language of the code ('sql', 'python', or 'r').
+        code_content : str
+            Content of the code file.
+        detail_level : DetailLevel
+            Level of documentation detail.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Keyword arguments for ``client.messages.create``.
+        """
+        # Get the appropriate prompt for language and detail level
+        prompt_template = self._prompt_getters[language](detail_level)
+
+        prompt_prefix, prompt_suffix = _prompt_parts(prompt_template)
+        prompt = code_content + prompt_suffix
+
+        # Append custom prompt suffix if configured
+        if self.custom_prompt_suffix:
+            prompt += f"\n\n---\nADDITIONAL INSTRUCTIONS:\n{self.custom_prompt_suffix}"
+
+        return {
+            "model": self.model,
+            "max_tokens": 4096,
+            "temperature": 0.2,
+            "messages": [{
+                "role": "user",
+                "content": _prompt_content(prompt_prefix, prompt)
+            }]
+        }
 
     def update(self, file_path: Path, existing_doc: Dict[str, Any],
                code_content: str, detail_level: DetailLevel = DetailLevel.CONCISE) -> str:
@@ -657,7 +1077,8 @@ Return ONLY the Roxygen2 comments (starting with #'), ready to be inserted direc
 
         This method takes existing documentation and improves it to match
         the standards for the file's language (SQL markdown, Python NumPy,
-        or R Roxygen2).
+        or R Roxygen2). If the existing documentation has no content, this
+        is equivalent to generate().
 
         Parameters
         ----------
@@ -686,41 +1107,27 @@ Return ONLY the Roxygen2 comments (starting with #'), ready to be inserted direc
         RateLimitError
             If API rate limit is exceeded.
         """
-        language = self._get_file_language(file_path)
+        # Nothing to improve on: this is a plain generate, which may be cached
+        if not (existing_doc.get('content') or '').strip():
+            return self.generate(file_path, code_content, detail_level)
+
+        language = self._get_file_language(file_path.suffix)
 
         # Get the appropriate prompt for language and detail level
-        if language == 'sql':
-            base_prompt = self._get_sql_prompt(detail_level)
-        elif language == 'python':
-            base_prompt = self._get_python_prompt(detail_level)
-        else:  # r
-            base_prompt = self._get_r_prompt(detail_level)
+        base_prompt = self._prompt_getters[language](detail_level)
 
         # Extract existing doc content
         existing_content = existing_doc.get('content', '')
 
-        # Create an update-specific prompt
-        update_prompt = f"""You are a technical documentation expert.
-
-TASK: Fix and improve the existing documentation to meet the required standards.
-
-EXISTING DOCUMENTATION:
+        # Create an update-specific prompt. The standard's requirements and
+        # instructions come first so they form a cacheable static prefix.
+        update_prefix = _update_prefix(base_prompt)
+        update_prompt = f"""EXISTING DOCUMENTATION:
 {existing_content}
 
 CODE BEING DOCUMENTED:
 {code_content}
 
-REQUIREMENTS:
-{base_prompt.split('REQUIREMENTS:')[1].split('CODE TO DOCUMENT:')[0]}
-
-INSTRUCTIONS:
-1. Review the existing documentation
-2. Fix any issues with format, structure, or accuracy
-3. Ensure it matches the required standard exactly
-4. Keep good parts of the existing documentation
-5. Add missing sections (parameters, returns, examples, etc.)
-6. Make sure examples are realistic and correct
-
 Return ONLY the corrected documentation, properly formatted and ready to use."""
 
         # Append custom prompt suffix if configured
@@ -739,36 +1146,17 @@ Return ONLY the corrected documentation, properly formatted and ready to use."""
                     total=None
                 )
 
-                message = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=4096,
-                    temperature=0.2,
-                    messages=[{
+                documentation = self._request_text({
+                    "model": self.model,
+                    "max_tokens": 4096,
+                    "temperature": 0.2,
+                    "messages": [{
                         "role": "user",
-                        "content": update_prompt
+                        "content": _prompt_content(update_prefix, update_prompt)
                     }]
-                )
-
-            # Extract text content from response
-            documentation = message.content[0].text
+                })
 
-            return documentation.strip()
+            return documentation
 
-        except RateLimitError as e:
-            raise DocGeneratorError(
-                f"API rate limit exceeded. Please wait and try again.\n"
-                f"Details: {e}"
-            )
-        except APIConnectionError as e:
-            raise DocGeneratorError(
-                f"Failed to connect to Anthropic API. Check your internet connection.\n"
-                f"Details: {e}"
-            )
-        except APIError as e:
-            raise DocGeneratorError(
-                f"API error occurred: {e}"
-            )
         except Exception as e:
-            raise DocGeneratorError(
-                f"Unexpected error during documentation update: {e}"
-            )
\ No newline at end of file
+            raise _api_error(e, "documentation update")
@@ -25,17 +25,66 @@ class DocParser:
         Optional[Dict[str, Any]]
             Parsed documentation structure or None if no docs found
         """
-        if not file_path.exists():
+        # Unbuffered binary read: small files are read whole, so skip the
+        # BufferedReader/TextIOWrapper layers; a missing file raises here too
+        try:
+            with open(file_path, 'rb', buffering=0) as f:
+                data = f.read()
+        except Exception:
             return None
 
+        return self.parse_bytes(data, file_path.suffix)
+
+    def parse_bytes(self, data: bytes, suffix: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse existing documentation from raw file contents.
+
+        Parameters
+        ----------
+        data : bytes
+            UTF-8 encoded code, e.g. as returned by Path.read_bytes()
+        suffix : str
+            File extension identifying the language (e.g. '.py')
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Parsed documentation structure or None if no docs found or the
+            data is not valid UTF-8
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+
+        # Match the universal-newline translation parse() gets from text mode
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+        return self.parse_string(content, suffix)
+
+    def parse_string(self, content: str, suffix: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse existing documentation from code already in memory.
+
+        Parameters
+        ----------
+        content : str
+            The code to parse
+        suffix : str
+            File extension identifying the language (e.g. '.py')
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Parsed documentation structure or None if no docs found
+        """
+        # Blank content cannot hold documentation in any language
+        if not content or content.isspace():
             return None
 
         # Detect file type and route to appropriate parser
-        suffix = file_path.suffix.lower()
+        suffix = suffix.lower()
         if suffix == '.sql':
             return self._parse_sql(content)
         elif suffix == '.py':
@@ -2,17 +2,28 @@
 Documentation validator module - checks compliance with standards.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Tuple
 from docugen.standards.sql_standard import SQLStandard
 from docugen.standards.python_standard import PythonStandard
 from docugen.standards.r_standard import RStandard
 
 
+# Documentation fields the language validators read; together with the file
+# suffix they fully determine the validation result
+_VALIDATED_FIELDS = ('name', 'description', 'parameters', 'returns', 'examples', 'raw_doc')
+
+# Marks a field absent from the documentation dict (distinct from None)
+_MISSING = object()
+
+
 class ValidationResult:
     """Result of documentation validation."""
 
-    def __init__(self, is_valid: bool, issues: List[str]):
+    __slots__ = ('is_valid', 'issues')
+
+    def __init__(self, is_valid: bool, issues: Iterable[str]):
         """
         Initialize validation result.
 
@@ -20,11 +31,11 @@ class ValidationResult:
         ----------
         is_valid : bool
             Whether the documentation is valid
-        issues : List[str]
-            List of validation issues found
+        issues : Iterable[str]
+            Validation issues found; stored as an immutable tuple
         """
         self.is_valid = is_valid
-        self.issues = issues
+        self.issues = tuple(issues)
 
     def __repr__(self):
         """String representation of validation result."""
@@ -32,9 +43,18 @@ class ValidationResult:
         return f"ValidationResult({status}, {len(self.issues)} issues)"
 
 
+# Shared result for files without documentation; its issues tuple is immutable
+_NONE_RESULT = ValidationResult(False, ("No documentation found",))
+
+
 class DocValidator:
     """Validates documentation against language standards."""
 
+    def __init__(self):
+        """Initialize the validator with its own memoized validation cache."""
+        # Per-instance so the cache never outlives or mixes validators
+        self._validate_cached = lru_cache(maxsize=1024)(self._validate_fields)
+
     def validate(self, file_path: Path, documentation: Dict[str, Any]) -> ValidationResult:
         """
         Validate documentation against language-specific standards.
@@ -52,10 +72,44 @@ class DocValidator:
             Validation result with any issues found
         """
         if documentation is None:
-            return ValidationResult(False, ["No documentation found"])
+            return _NONE_RESULT
 
-        # Detect file type and route to appropriate validator
         suffix = file_path.suffix.lower()
+        key = tuple(documentation.get(field, _MISSING) for field in _VALIDATED_FIELDS)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable field values cannot be cached; validate directly
+            return self._validate_suffix(suffix, documentation)
+
+        is_valid, issues = self._validate_cached(suffix, key)
+        return ValidationResult(is_valid, issues)
+
+    def _validate_fields(self, suffix: str, key: Tuple[Any, ...]) -> Tuple[bool, Tuple[str, ...]]:
+        """
+        Validate documentation fields, memoized on suffix and field values.
+
+        Parameters
+        ----------
+        suffix : str
+            Lowercased file extension
+        key : Tuple[Any, ...]
+            Values of _VALIDATED_FIELDS, with _MISSING for absent fields
+
+        Returns
+        -------
+        Tuple[bool, Tuple[str, ...]]
+            Validity flag and issues; callers get a fresh ValidationResult
+        """
+        doc = {
+            field: value for field, value in zip(_VALIDATED_FIELDS, key)
+            if value is not _MISSING
+        }
+        result = self._validate_suffix(suffix, doc)
+        return result.is_valid, tuple(result.issues)
+
+    def _validate_suffix(self, suffix: str, documentation: Dict[str, Any]) -> ValidationResult:
+        """Route documentation to the validator for a lowercased file extension."""
         if suffix == '.sql':
             return self._validate_sql(documentation)
         elif suffix == '.py':
@@ -218,11 +272,8 @@ class DocValidator:
                 issues.append("Empty @return section")
 
         # Check that all lines start with #'
-        lines = raw_doc.split('\n')
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#'"):
-                issues.append(f"Line {i} does not start with #' marker")
-                break
+        line_no = RStandard.find_unmarked_line(raw_doc)
+        if line_no is not None:
+            issues.append(f"Line {line_no} does not start with #' marker")
 
         return ValidationResult(len(issues) == 0, issues)
\ No newline at end of file
@@ -2,8 +2,9 @@
 File discovery module - finds valid files to process.
 """
 
+import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 
 class FileDiscovery:
@@ -28,10 +29,41 @@ class FileDiscovery:
         if path.is_file():
             return [path] if self._is_valid_file(path) else []
 
-        return [
-            f for f in path.rglob('*')
-            if f.is_file() and self._is_valid_file(f)
-        ]
+        return [Path(file_path) for file_path in self._walk(os.fspath(path))]
+
+    def _walk(self, root: str) -> Iterator[str]:
+        """
+        Yield supported file paths under root.
+
+        Uses os.scandir so file-type checks come from the cached directory
+        entry instead of a stat call per file. Like Path.rglob, symlinked
+        directories are not descended into, and directories that are
+        unreadable, missing or removed during the walk are skipped.
+
+        Parameters
+        ----------
+        root : str
+            Directory to search
+
+        Yields
+        ------
+        str
+            Path of each supported file
+        """
+        subdirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif (os.path.splitext(entry.name)[1].lower() in self.SUPPORTED_EXTENSIONS
+                          and entry.is_file()):
+                        yield entry.path
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            return
+
+        for subdir in subdirs:
+            yield from self._walk(subdir)
 
     def _is_valid_file(self, file_path: Path) -> bool:
         """Check if file has supported extension."""
@@ -3,14 +3,261 @@ File writer module - safely writes modified files.
 """
 
 from pathlib import Path
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import ast
+import errno
+import os
 import re
+import sys
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path_str: str) -> Tuple[str, str, str]:
+    """Split a path into (parent, stem, extension); the same file is often written repeatedly."""
+    parent, name = os.path.split(path_str)
+    stem, ext = os.path.splitext(name)
+    if ext == '.':
+        # Like Path.suffix, a trailing dot is not an extension
+        stem, ext = name, ''
+    return parent, stem, ext
+
+
+def _encode_text(content: str) -> bytes:
+    """Encode text as UTF-8 with the newline translation write_text() applies."""
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return content.encode('utf-8')
+
+
+def _encode_content(content: Union[str, bytes, bytearray, memoryview]) -> Union[bytes, bytearray, memoryview]:
+    """Return bytes-like content unchanged and encode text with _encode_text()."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return content
+    return _encode_text(content)
+
+
+def _target_name(original_path: Path, suffix: str) -> Tuple[str, str]:
+    """Return (parent, file name) for original_path with suffix inserted before its extension."""
+    parent, stem, ext = _split_path(os.fspath(original_path))
+    return parent, f"{stem}{suffix}{ext}"
+
+
+def _open_shared_dirs(parents: Iterable[str]) -> Dict[str, int]:
+    """
+    Open each directory that receives more than one file.
+
+    Files are then created relative to the open descriptor, so the kernel
+    resolves the directory path once instead of once per file.
+
+    Parameters
+    ----------
+    parents : Iterable[str]
+        Parent directory of every file about to be written ('' for the
+        current directory)
+
+    Returns
+    -------
+    Dict[str, int]
+        Directory descriptor per shared parent; empty where dir_fd is not
+        supported. Directories that cannot be opened are left out, so their
+        files fall back to full paths and report errors as usual.
+    """
+    if os.open not in os.supports_dir_fd:
+        return {}
+
+    dir_fds = {}
+    for parent, count in Counter(parents).items():
+        if count < 2:
+            continue
+        try:
+            dir_fds[parent] = os.open(parent or os.curdir, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError:
+            pass
+    return dir_fds
+
+
+def _write_whole(path: Union[str, Path], data: Union[bytes, bytearray, memoryview],
+                 dir_fd: Optional[int] = None) -> None:
+    """
+    Write a whole-file payload straight to a file descriptor.
+
+    Skips the BufferedWriter that Path.write_bytes() builds (buffer allocation
+    plus seek/isatty probes), which buys nothing for a single write call.
+
+    Parameters
+    ----------
+    path : str or Path
+        File to create or truncate
+    data : bytes-like
+        Complete file contents
+    dir_fd : Optional[int], optional
+        Directory descriptor that a relative path is resolved against
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666,
+                 dir_fd=dir_fd)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _iov_max() -> int:
+    """Most buffers a single os.writev call accepts (IOV_MAX, 1024 on Linux)."""
+    try:
+        limit = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        return 1024
+    return limit if limit > 0 else 1024
+
+
+_IOV_MAX = _iov_max()
+
+
+def _write_chunks(path: Union[str, Path], chunks: List[Union[bytes, bytearray, memoryview]]) -> None:
+    """
+    Write a file from several buffers with gathered writev calls.
+
+    Buffers are sent in groups of at most IOV_MAX, since the kernel rejects
+    larger vectors. Falls back to joining the buffers where os.writev is
+    unavailable (Windows) and finishes any short write with a plain write.
+
+    Parameters
+    ----------
+    path : str or Path
+        File to create or truncate
+    chunks : List[bytes-like]
+        File contents, in order
+    """
+    if not hasattr(os, 'writev'):
+        _write_whole(path, b''.join(chunks))
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        for start in range(0, len(chunks), _IOV_MAX):
+            group = chunks[start:start + _IOV_MAX]
+            total = sum(memoryview(chunk).nbytes for chunk in group)
+            written = os.writev(fd, group)
+            if written < total:
+                view = memoryview(b''.join(group))[written:]
+                while view:
+                    view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# copy_file_range/sendfile errors meaning "not possible here" rather than a real I/O failure
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+
+# sendfile() to a regular file is only supported on Linux (macOS requires a socket)
+_USE_SENDFILE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
+# Chunk size for the sendfile and read/write fallbacks
+_COPY_CHUNK = 1024 * 1024
+
+
+def _copy_range(src_fd: int, dst_fd: int) -> bool:
+    """
+    Copy a whole file in the kernel with os.copy_file_range.
+
+    Parameters
+    ----------
+    src_fd : int
+        Descriptor of the file to copy, positioned at its start
+    dst_fd : int
+        Descriptor of the empty destination file
+
+    Returns
+    -------
+    bool
+        True if the file was fully copied, False if copy_file_range is
+        unavailable or unsupported for these files. Both descriptors are
+        left positioned after whatever was copied.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return False
+
+    size = os.fstat(src_fd).st_size
+    copied = 0
+    try:
+        while copied < size:
+            count = os.copy_file_range(src_fd, dst_fd, size - copied)
+            if count == 0:
+                break
+            copied += count
+    except OSError as e:
+        if e.errno in _COPY_RANGE_UNSUPPORTED:
+            return False
+        raise
+    return copied == size
+
+
+def _sync(fd: int) -> None:
+    """Flush a file's data to disk, skipping metadata where the platform allows."""
+    getattr(os, 'fdatasync', os.fsync)(fd)
+
+
+def _copy_rest(src_fd: int, dst_fd: int) -> None:
+    """Copy from the current position of src_fd to dst_fd until end of file."""
+    if _USE_SENDFILE:
+        try:
+            while os.sendfile(dst_fd, src_fd, None, _COPY_CHUNK):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                raise
+
+    while True:
+        chunk = os.read(src_fd, _COPY_CHUNK)
+        if not chunk:
+            return
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view):]
+
+
+def _copy_file(src: Union[str, Path], dst: Union[str, Path], durable: bool = False) -> None:
+    """
+    Copy file contents without moving them through Python objects.
+
+    Both files are opened exactly once; a missing source raises
+    FileNotFoundError before the destination is created, and an existing
+    destination is truncated without a separate stat probe.
+
+    Parameters
+    ----------
+    src : str or Path
+        File to copy
+    dst : str or Path
+        Destination file, created or truncated
+    durable : bool, optional
+        Flush the copy to disk before returning (default: False)
+    """
+    binary = getattr(os, 'O_BINARY', 0)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o666)
+        try:
+            if not _copy_range(src_fd, dst_fd):
+                _copy_rest(src_fd, dst_fd)
+            if durable:
+                _sync(dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
 
 
 class FileWriter:
     """Handles safe file writing operations and documentation injection."""
 
-    def write(self, original_path: Path, content: str, suffix: str) -> Path:
+    def write(self, original_path: Path, content: Union[str, bytes], suffix: str) -> Path:
         """
         Write modified file with suffix (legacy method for backward compatibility).
 
@@ -18,8 +265,9 @@ class FileWriter:
         ----------
         original_path : Path
             Original file path
-        content : str
-            Modified file content
+        content : str or bytes
+            Modified file content. Text is encoded as UTF-8; bytes-like
+            content is written as-is.
         suffix : str
             Suffix to add to filename
 
@@ -28,14 +276,117 @@ class FileWriter:
         Path
             Path to the written file
         """
-        # Create new filename with suffix
-        new_name = f"{original_path.stem}{suffix}{original_path.suffix}"
-        new_path = original_path.parent / new_name
+        # Create new filename with suffix; the Path is only built for the return value
+        new_path = os.path.join(*_target_name(original_path, suffix))
 
         # Write file
-        new_path.write_text(content, encoding='utf-8')
+        _write_whole(new_path, _encode_content(content))
+
+        return Path(new_path)
+
+    def safe_modify(self, original_path: Path, content: Union[str, bytes], suffix: str) -> Path:
+        """
+        Write modified file with suffix, backing up the original only when overwritten.
+
+        A non-empty suffix writes a side file and leaves the original
+        untouched, so no backup copy is made.
+
+        Parameters
+        ----------
+        original_path : Path
+            Original file path
+        content : str or bytes
+            Modified file content, as taken by write()
+        suffix : str
+            Suffix to add to filename
+
+        Returns
+        -------
+        Path
+            Path to the written file
+        """
+        _, name = _target_name(original_path, suffix)
+        if name == os.path.basename(os.fspath(original_path)):
+            self.backup(original_path)
+        return self.write(original_path, content, suffix)
+
+    def write_chunks(self, original_path: Path,
+                     chunks: Iterable[Union[bytes, bytearray, memoryview]], suffix: str) -> Path:
+        """
+        Write modified file with suffix from separate byte buffers.
+
+        Useful when the documentation header and the original source are
+        already held as separate buffers: they are written with a single
+        gathered write instead of being concatenated first.
+
+        Parameters
+        ----------
+        original_path : Path
+            Original file path
+        chunks : Iterable[bytes-like]
+            File contents, in order
+        suffix : str
+            Suffix to add to filename
+
+        Returns
+        -------
+        Path
+            Path to the written file
+        """
+        new_path = os.path.join(*_target_name(original_path, suffix))
+
+        _write_chunks(new_path, list(chunks))
+
+        return Path(new_path)
 
-        return new_path
+    def write_many(self, jobs: Iterable[Tuple[Path, Union[str, bytes], str]],
+                   max_workers: Optional[int] = None) -> List[Path]:
+        """
+        Write several modified files with suffixes.
+
+        Files are written from a thread pool; the GIL is released during the
+        underlying os.write calls, so independent files overlap their I/O.
+        Directories receiving several files are opened once and the files
+        created relative to them.
+
+        Parameters
+        ----------
+        jobs : Iterable[Tuple[Path, str or bytes, str]]
+            (original_path, content, suffix) for each file, as taken by write()
+        max_workers : Optional[int], optional
+            Maximum number of writer threads (default: ThreadPoolExecutor's
+            default). With 1, or a single job, files are written inline.
+
+        Returns
+        -------
+        List[Path]
+            Paths to the written files, in job order
+
+        Raises
+        ------
+        OSError
+            The first error raised by any write; other jobs may still have
+            been written
+        """
+        targets = [(_target_name(original_path, suffix), content) for original_path, content, suffix in jobs]
+        dir_fds = _open_shared_dirs(parent for (parent, _), _ in targets)
+
+        def write_target(target):
+            (parent, name), content = target
+            dir_fd = dir_fds.get(parent)
+            new_path = os.path.join(parent, name)
+            _write_whole(new_path if dir_fd is None else name, _encode_content(content), dir_fd=dir_fd)
+            return Path(new_path)
+
+        try:
+            if len(targets) <= 1 or max_workers == 1:
+                return [write_target(target) for target in targets]
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(write_target, targets))
+        finally:
+            for dir_fd in dir_fds.values():
+                os.close(dir_fd)
 
     def inject_documentation(self, file_path: Path, documentation: str) -> Path:
         """
@@ -68,7 +419,7 @@ class FileWriter:
             raise ValueError(f"Unsupported file type: {suffix}")
 
         # Write back to original file
-        file_path.write_text(modified_content, encoding='utf-8')
+        _write_whole(file_path, _encode_text(modified_content))
 
         return file_path
 
@@ -266,8 +617,23 @@ class FileWriter:
 
         return '\n'.join(lines)
 
-    def backup(self, file_path: Path) -> Path:
-        """Create backup of original file."""
-        backup_path = file_path.with_suffix(file_path.suffix + '.backup')
-        backup_path.write_bytes(file_path.read_bytes())
-        return backup_path
\ No newline at end of file
+    def backup(self, file_path: Path, durable: bool = False) -> Path:
+        """
+        Create backup of original file.
+
+        Parameters
+        ----------
+        file_path : Path
+            File to back up
+        durable : bool, optional
+            Flush the backup to disk before returning, so it survives a crash
+            during the following in-place edit (default: False)
+
+        Returns
+        -------
+        Path
+            Path to the backup file
+        """
+        backup_path = os.fspath(file_path) + '.backup'
+        _copy_file(file_path, backup_path, durable)
+        return Path(backup_path)
\ No newline at end of file
@@ -2,6 +2,8 @@
 Python documentation standard - NumPy/SciPy-style docstrings.
 """
 
+from docugen.standards.template import compile_template, render_template
+
 
 PYTHON_TEMPLATE = '''
 """
@@ -23,6 +25,17 @@ Examples
 """
 '''
 
+_PYTHON_TEMPLATE_PARTS = compile_template(PYTHON_TEMPLATE)
+
+# Required NumPy sections, ordered so the section headers (the usual reason
+# a docstring fails) are tested before the underlines
+_REQUIRED_SECTIONS = (
+    'Parameters',
+    'Returns',
+    '----------',
+    '-------'
+)
+
 
 class PythonStandard:
     """NumPy/SciPy-style docstring standard."""
@@ -32,6 +45,23 @@ class PythonStandard:
         """Get Python documentation template."""
         return PYTHON_TEMPLATE
 
+    @staticmethod
+    def render(**fields: str) -> str:
+        """
+        Render the NumPy template with the given field values.
+
+        Parameters
+        ----------
+        **fields : str
+            Value for each template placeholder
+
+        Returns
+        -------
+        str
+            Rendered documentation, identical to get_template().format(**fields)
+        """
+        return render_template(_PYTHON_TEMPLATE_PARTS, fields)
+
     @staticmethod
     def validate_structure(doc: str) -> bool:
         """
@@ -51,19 +81,13 @@ class PythonStandard:
             return False
 
         # Check that docstring is enclosed in triple quotes
-        if not (doc.strip().startswith('"""') or doc.strip().startswith("'''")):
+        stripped = doc.strip()
+        if not (stripped.startswith('"""') or stripped.startswith("'''")):
             return False
 
         # Check for required NumPy sections
-        required_sections = [
-            'Parameters',
-            '----------',
-            'Returns',
-            '-------'
-        ]
-
-        for section in required_sections:
+        for section in _REQUIRED_SECTIONS:
             if section not in doc:
                 return False
 
-        return True
\ No newline at end of file
+        return True
@@ -2,6 +2,11 @@
 R documentation standard - Roxygen2.
 """
 
+import re
+from typing import Optional, Union
+
+from docugen.standards.template import compile_template, render_template
+
 
 R_TEMPLATE = """
 #' {title}
@@ -15,6 +20,36 @@ R_TEMPLATE = """
 #' @export
 """
 
+_R_TEMPLATE_PARTS = compile_template(R_TEMPLATE)
+
+# Required Roxygen2 tokens, matched in a single pass over the doc
+_REQUIRED_TAGS = frozenset(("#'", "@param", "@return"))
+_REQUIRED_TAGS_RE = re.compile(r"#'|@param|@return")
+
+# Shortest doc that could contain every required tag
+_R_MIN_LEN = sum(len(tag) for tag in _REQUIRED_TAGS)
+
+# First non-blank line whose content does not start with the #' marker
+_R_BAD_LINE_RE = re.compile(r"(?m)^[^\S\n]*(?!#')\S")
+
+# Byte-string equivalents so ASCII file contents can be checked without
+# decoding; bytes patterns only know ASCII whitespace, so other input is
+# decoded first (see _ascii_or_text)
+_REQUIRED_TAGS_B = frozenset(tag.encode() for tag in _REQUIRED_TAGS)
+_REQUIRED_TAGS_RE_B = re.compile(rb"#'|@param|@return")
+_R_BAD_LINE_RE_B = re.compile(rb"(?m)^[^\S\n]*(?!#')\S")
+
+
+def _ascii_or_text(doc: Union[str, bytes, bytearray, memoryview]) -> Union[str, bytes]:
+    """Return ASCII bytes as-is and decode other bytes-like input as UTF-8."""
+    if isinstance(doc, str):
+        return doc
+    doc = bytes(doc)
+    if doc.isascii():
+        return doc
+    # Non-ASCII whitespace such as U+00A0 only matches the Unicode-aware str patterns
+    return doc.decode('utf-8', errors='replace')
+
 
 class RStandard:
     """Roxygen2 documentation standard."""
@@ -25,39 +60,83 @@ class RStandard:
         return R_TEMPLATE
 
     @staticmethod
-    def validate_structure(doc: str) -> bool:
+    def render(**fields: str) -> str:
+        """
+        Render the Roxygen2 template with the given field values.
+
+        Parameters
+        ----------
+        **fields : str
+            Value for each template placeholder
+
+        Returns
+        -------
+        str
+            Rendered documentation, identical to get_template().format(**fields)
+        """
+        return render_template(_R_TEMPLATE_PARTS, fields)
+
+    @staticmethod
+    def validate_structure(doc: Union[str, bytes]) -> bool:
         """
         Validate Roxygen2 documentation structure.
 
         Parameters
         ----------
-        doc : str
-            The documentation string to validate
+        doc : str or bytes
+            The documentation to validate. ASCII bytes-like input is checked
+            directly; other bytes are decoded as UTF-8 first, so the result
+            always matches the str path.
 
         Returns
         -------
         bool
             True if documentation follows Roxygen2 standard, False otherwise
         """
-        if not doc or not isinstance(doc, str):
+        if isinstance(doc, (bytes, bytearray, memoryview)):
+            doc = _ascii_or_text(doc)
+
+        if isinstance(doc, str):
+            required, tags_re = _REQUIRED_TAGS, _REQUIRED_TAGS_RE
+        elif isinstance(doc, bytes):
+            required, tags_re = _REQUIRED_TAGS_B, _REQUIRED_TAGS_RE_B
+        else:
             return False
 
-        # Check for required Roxygen2 tags
-        required_tags = [
-            "#'",  # Roxygen2 comment marker
-            "@param",
-            "@return"
-        ]
+        if len(doc) < _R_MIN_LEN:
+            return False
 
-        for tag in required_tags:
-            if tag not in doc:
-                return False
+        # Check for required Roxygen2 tags
+        if not required.issubset(tags_re.findall(doc)):
+            return False
 
         # Check that each line with content starts with #'
-        lines = doc.split('\n')
-        for line in lines:
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#'"):
-                return False
+        return RStandard.find_unmarked_line(doc) is None
+
+    @staticmethod
+    def find_unmarked_line(doc: Union[str, bytes]) -> Optional[int]:
+        """
+        Find the first non-blank line that does not start with #'.
+
+        Parameters
+        ----------
+        doc : str or bytes
+            The documentation to check; non-ASCII bytes are decoded as UTF-8
+
+        Returns
+        -------
+        Optional[int]
+            1-based line number of the first unmarked line, or None if every
+            line with content starts with #'
+        """
+        doc = _ascii_or_text(doc)
+        if isinstance(doc, str):
+            match = _R_BAD_LINE_RE.search(doc)
+            newline = '\n'
+        else:
+            match = _R_BAD_LINE_RE_B.search(doc)
+            newline = b'\n'
 
-        return True
\ No newline at end of file
+        if match is None:
+            return None
+        return doc.count(newline, 0, match.start()) + 1
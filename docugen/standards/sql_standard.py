@@ -2,6 +2,11 @@
 SQL documentation standard - Markdown-style.
 """
 
+import re
+from typing import Union
+
+from docugen.standards.template import compile_template, render_template
+
 
 SQL_TEMPLATE = """
 -- # {function_name}
@@ -19,6 +24,24 @@ SQL_TEMPLATE = """
 -- {example}
 """
 
+_SQL_TEMPLATE_PARTS = compile_template(SQL_TEMPLATE)
+
+# Required markdown section headers, matched case-insensitively in one pass.
+# The '-- #' name header is implied by any of them.
+_REQUIRED_SECTIONS = frozenset(('description', 'parameters', 'returns', 'example'))
+_SQL_SECTIONS_RE = re.compile(
+    r'-- ## (description|parameters|returns|example)', re.IGNORECASE
+)
+
+# Shortest doc that could contain every required section header
+_SQL_MIN_LEN = sum(len('-- ## ' + section) for section in _REQUIRED_SECTIONS)
+
+# Byte-string equivalents so raw file contents can be checked without decoding
+_REQUIRED_SECTIONS_B = frozenset(section.encode() for section in _REQUIRED_SECTIONS)
+_SQL_SECTIONS_RE_B = re.compile(
+    rb'-- ## (description|parameters|returns|example)', re.IGNORECASE
+)
+
 
 class SQLStandard:
     """SQL markdown-style documentation standard."""
@@ -29,35 +52,51 @@ class SQLStandard:
         return SQL_TEMPLATE
 
     @staticmethod
-    def validate_structure(doc: str) -> bool:
+    def render(**fields: str) -> str:
+        """
+        Render the SQL markdown template with the given field values.
+
+        Parameters
+        ----------
+        **fields : str
+            Value for each template placeholder
+
+        Returns
+        -------
+        str
+            Rendered documentation, identical to get_template().format(**fields)
+        """
+        return render_template(_SQL_TEMPLATE_PARTS, fields)
+
+    @staticmethod
+    def validate_structure(doc: Union[str, bytes]) -> bool:
         """
         Validate SQL documentation structure.
 
         Parameters
         ----------
-        doc : str
-            The documentation string to validate
+        doc : str or bytes
+            The documentation to validate. Bytes-like input is checked
+            directly without decoding.
 
         Returns
         -------
         bool
             True if documentation follows SQL markdown standard, False otherwise
         """
-        if not doc or not isinstance(doc, str):
+        if isinstance(doc, (bytearray, memoryview)):
+            doc = bytes(doc)
+
+        if isinstance(doc, str):
+            required, sections_re = _REQUIRED_SECTIONS, _SQL_SECTIONS_RE
+        elif isinstance(doc, bytes):
+            required, sections_re = _REQUIRED_SECTIONS_B, _SQL_SECTIONS_RE_B
+        else:
+            return False
+
+        if len(doc) < _SQL_MIN_LEN:
             return False
 
         # Check for required markdown headers
-        required_sections = [
-            '-- #',  # Function/query name header
-            '-- ## Description',
-            '-- ## Parameters',
-            '-- ## Returns',
-            '-- ## Example'
-        ]
-
-        doc_lower = doc.lower()
-        for section in required_sections:
-            if section.lower() not in doc_lower:
-                return False
-
-        return True
\ No newline at end of file
+        found = {section.lower() for section in sections_re.findall(doc)}
+        return required.issubset(found)
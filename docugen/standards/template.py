@@ -0,0 +1,59 @@
+"""
+Precompiled documentation templates.
+"""
+
+import re
+from typing import Any, Dict, Tuple
+
+# Placeholder fields such as {description}
+_FIELD_RE = re.compile(r"\{(\w+)\}")
+
+CompiledTemplate = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Split a template into its literal text and placeholder field names.
+
+    Parameters
+    ----------
+    template : str
+        Template using {field} placeholders
+
+    Returns
+    -------
+    CompiledTemplate
+        Tuple of (literals, fields) where literals has one more entry
+        than fields and the two interleave to rebuild the template
+    """
+    parts = _FIELD_RE.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def render_template(compiled: CompiledTemplate, values: Dict[str, Any]) -> str:
+    """
+    Render a compiled template with the given field values.
+
+    Parameters
+    ----------
+    compiled : CompiledTemplate
+        Template produced by compile_template
+    values : Dict[str, Any]
+        Value for each placeholder field
+
+    Returns
+    -------
+    str
+        Rendered documentation
+
+    Raises
+    ------
+    KeyError
+        If a placeholder field has no value
+    """
+    literals, fields = compiled
+    out = [literals[0]]
+    for field, literal in zip(fields, literals[1:]):
+        out.append(str(values[field]))
+        out.append(literal)
+    return ''.join(out)
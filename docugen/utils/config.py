@@ -2,11 +2,11 @@
 Configuration management.
 """
 
-import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any
 from enum import Enum
-import yaml
+from docugen.utils.config_manager import resolve_api_key
 
 
 class DetailLevel(Enum):
@@ -27,6 +27,40 @@ class DetailLevel(Enum):
     VERBOSE = "verbose"
 
 
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Load and parse a YAML file, memoized on its path and stat signature.
+
+    Parameters
+    ----------
+    path_str : str
+        Resolved path to the YAML file.
+    mtime_ns : int
+        File modification time in nanoseconds (cache key only).
+    size : int
+        File size in bytes (cache key only).
+
+    Returns
+    -------
+    Dict[str, Any]
+        Parsed YAML mapping, or an empty dict for an empty file.
+
+    Notes
+    -----
+    The returned dict is shared between callers and must not be mutated.
+    A changed file gets a new mtime/size and therefore a fresh cache entry.
+    """
+    # Deferred so importing the package does not pay for yaml
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # libyaml not available
+        from yaml import SafeLoader
+
+    return yaml.load(Path(path_str).read_bytes(), Loader=SafeLoader) or {}
+
+
 class Config:
     """
     Application configuration.
@@ -39,7 +73,7 @@ class Config:
     ----------
     api_key : str, optional
         Anthropic API key. If not provided, reads from ANTHROPIC_API_KEY
-        environment variable.
+        environment variable, then the saved DocuGen config file.
     default_suffix : str, optional
         Default suffix for modified files. Defaults to '__cli_dcreate_modified'.
 
@@ -65,11 +99,11 @@ class Config:
         Parameters
         ----------
         api_key : str, optional
-            Anthropic API key. If None, reads from environment.
+            Anthropic API key. If None, reads from environment or config file.
         default_suffix : str, optional
             Suffix for modified files.
         """
-        self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        self.api_key = api_key or resolve_api_key()
         self.default_suffix = default_suffix
 
     @classmethod
@@ -104,11 +138,12 @@ class Config:
         --------
         >>> config = Config.from_file(Path("config.yaml"))
         """
-        if not config_path.exists():
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_yaml_cached(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
 
         config = cls()
 
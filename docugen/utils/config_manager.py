@@ -4,8 +4,116 @@ Configuration manager for storing API keys and settings.
 
 import os
 import json
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def get_config_dir() -> Path:
+    """Get platform-specific configuration directory."""
+    if os.name == 'nt':  # Windows
+        base = os.environ.get('APPDATA', os.path.expanduser('~'))
+        return Path(base) / 'DocuGen'
+    else:  # macOS/Linux
+        return Path.home() / '.docugen'
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, inode: int, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Load and parse a JSON config file, memoized on its path and stat signature.
+
+    Parameters
+    ----------
+    path_str : str
+        Path to the JSON config file.
+    inode : int
+        File inode (cache key only; changes when the file is replaced).
+    mtime_ns : int
+        File modification time in nanoseconds (cache key only).
+    size : int
+        File size in bytes (cache key only).
+
+    Returns
+    -------
+    Dict[str, Any]
+        Parsed configuration, or an empty dict if the file is unreadable.
+        The dict is shared between callers and must not be mutated.
+    """
+    try:
+        return _json_loads(Path(path_str).read_bytes())
+    except (json.JSONDecodeError, IOError):
+        return {}
+
+
+def read_config_file(config_file: Path) -> Dict[str, Any]:
+    """
+    Read a JSON config file, reusing the last parse while it is unchanged.
+
+    Parameters
+    ----------
+    config_file : Path
+        Path to the JSON config file.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Parsed configuration, or an empty dict if the file is missing or
+        unreadable. The dict is shared and must not be mutated.
+    """
+    try:
+        stat = config_file.stat()
+    except OSError:
+        return {}
+
+    return _load_config_cached(str(config_file), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def resolve_api_key(config_file: Optional[Path] = None) -> Optional[str]:
+    """
+    Resolve the Anthropic API key from the environment or config file.
+
+    Parameters
+    ----------
+    config_file : Path, optional
+        JSON config file to fall back to. Defaults to config.json in the
+        platform-specific configuration directory.
+
+    Returns
+    -------
+    Optional[str]
+        API key if found, None otherwise
+
+    Notes
+    -----
+    The ANTHROPIC_API_KEY environment variable takes precedence. The config
+    file is parsed at most once per change, so repeated lookups are cheap.
+    """
+    # First check environment variable
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if api_key:
+        return api_key
+
+    # Then check config file
+    if config_file is None:
+        config_file = get_config_dir() / "config.json"
+    return read_config_file(config_file).get('anthropic_api_key')
 
 
 class ConfigManager:
@@ -19,16 +127,52 @@ class ConfigManager:
 
     def _get_config_dir(self) -> Path:
         """Get platform-specific configuration directory."""
-        if os.name == 'nt':  # Windows
-            base = os.environ.get('APPDATA', os.path.expanduser('~'))
-            return Path(base) / 'DocuGen'
-        else:  # macOS/Linux
-            return Path.home() / '.docugen'
+        return get_config_dir()
 
     def _ensure_config_dir(self):
         """Create configuration directory if it doesn't exist."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
+    def _read_config(self) -> Dict[str, Any]:
+        """
+        Read the config file, reusing the last parse while it is unchanged.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parsed configuration, or an empty dict if the file is missing or
+            unreadable. The dict is shared and must not be mutated.
+        """
+        return read_config_file(self.config_file)
+
+    def _write_config(self, config: Dict[str, Any]):
+        """
+        Write configuration to the config file.
+
+        Parameters
+        ----------
+        config : Dict[str, Any]
+            Configuration to save
+        """
+        # Write to a temporary file and swap it in so readers never see a
+        # partially written config
+        fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, prefix='.config-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(config))
+
+            # Set restrictive permissions (owner only)
+            if os.name != 'nt':  # Unix-like systems
+                os.chmod(tmp_path, 0o600)
+
+            os.replace(tmp_path, self.config_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def get_api_key(self) -> Optional[str]:
         """
         Get API key from config file or environment variable.
@@ -38,21 +182,7 @@ class ConfigManager:
         Optional[str]
             API key if found, None otherwise
         """
-        # First check environment variable
-        api_key = os.environ.get('ANTHROPIC_API_KEY')
-        if api_key:
-            return api_key
-
-        # Then check config file
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    return config.get('anthropic_api_key')
-            except (json.JSONDecodeError, IOError):
-                return None
-
-        return None
+        return resolve_api_key(self.config_file)
 
     def set_api_key(self, api_key: str):
         """
@@ -63,26 +193,18 @@ class ConfigManager:
         api_key : str
             Anthropic API key to save
         """
-        config = {}
-
         # Load existing config if it exists
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        existing = self._read_config()
+        if existing.get('anthropic_api_key') == api_key:
+            return  # Unchanged, skip rewriting the file
+
+        config = dict(existing)
 
         # Update API key
         config['anthropic_api_key'] = api_key
 
         # Save config
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-
-        # Set restrictive permissions (owner only)
-        if os.name != 'nt':  # Unix-like systems
-            os.chmod(self.config_file, 0o600)
+        self._write_config(config)
 
     def has_api_key(self) -> bool:
         """
@@ -104,15 +226,7 @@ class ConfigManager:
         Optional[str]
             Custom prompt suffix if configured, None otherwise
         """
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    return config.get('custom_prompt_suffix')
-            except (json.JSONDecodeError, IOError):
-                return None
-
-        return None
+        return self._read_config().get('custom_prompt_suffix')
 
     def set_custom_prompt(self, custom_prompt: str):
         """
@@ -123,26 +237,18 @@ class ConfigManager:
         custom_prompt : str
             Custom prompt text to append to all documentation prompts
         """
-        config = {}
-
         # Load existing config if it exists
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        existing = self._read_config()
+        if existing.get('custom_prompt_suffix') == custom_prompt:
+            return  # Unchanged, skip rewriting the file
+
+        config = dict(existing)
 
         # Update custom prompt
         config['custom_prompt_suffix'] = custom_prompt
 
         # Save config
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-
-        # Set restrictive permissions (owner only)
-        if os.name != 'nt':  # Unix-like systems
-            os.chmod(self.config_file, 0o600)
+        self._write_config(config)
 
     def prompt_for_api_key(self) -> str:
         """
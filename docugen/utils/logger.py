@@ -3,7 +3,6 @@ Logging utilities.
 """
 
 import logging
-from rich.logging import RichHandler
 
 
 def setup_logger(name: str, verbose: bool = False) -> logging.Logger:
@@ -22,10 +21,14 @@ def setup_logger(name: str, verbose: bool = False) -> logging.Logger:
     logging.Logger
         Configured logger
     """
+    from rich.logging import RichHandler
+
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG if verbose else logging.INFO)
 
-    handler = RichHandler(rich_tracebacks=True)
-    logger.addHandler(handler)
+    # Attach the handler only once so repeated setup does not duplicate output
+    if not any(isinstance(h, RichHandler) for h in logger.handlers):
+        handler = RichHandler(rich_tracebacks=True)
+        logger.addHandler(handler)
 
     return logger
\ No newline at end of file
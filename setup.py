@@ -1,9 +1,12 @@
-import os
+from pathlib import Path
 from setuptools import setup, find_packages
 
+HERE = Path(__file__).parent
+README = HERE / "README.md"
+
 # Read version from package
 def get_version():
-    with open("docugen/__init__.py") as f:
+    with open(HERE / "docugen" / "__init__.py") as f:
         for line in f:
             if line.startswith("__version__"):
                 return line.split('"')[1]
@@ -24,6 +27,8 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
+            "pyfakefs>=5.0.0",
             "autopep8>=2.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
@@ -38,7 +43,7 @@ setup(
     author="Your Name",
     author_email="your.email@example.com",
     description="CLI tool for automated code documentation",
-    long_description=open("README.md", encoding="utf-8").read() if os.path.exists("README.md") else "",
+    long_description=README.read_text(encoding="utf-8") if README.exists() else "",
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/docugen",
     classifiers=[
@@ -0,0 +1,150 @@
+"""
+Shared pytest fixtures.
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from docugen.core.doc_generator import _get_client
+from docugen.core.doc_parser import DocParser
+from docugen.core.doc_validator import DocValidator
+from docugen.core.file_writer import FileWriter
+
+
+# Resolved once so per-test paths built from it need no further symlink lookups
+FIXTURES_DIR = (Path(__file__).parent / "fixtures").resolve()
+CASSETTE_DIR = FIXTURES_DIR / "anthropic"
+
+
+def pytest_configure(config):
+    """Register the markers used across the suite."""
+    # Registered so grouped modules also run cleanly without pytest-xdist
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests on one xdist worker under --dist loadgroup"
+    )
+    config.addinivalue_line("markers", "integration: end-to-end tests across components")
+    config.addinivalue_line("markers", "slow: tests that build many or large files")
+
+
+# Suffixes of fixture files the parser and validator understand
+SOURCE_SUFFIXES = frozenset(('.py', '.sql', '.r'))
+
+
+@lru_cache(maxsize=None)
+def _list_fixtures():
+    """List the fixtures directory in one scandir pass; it never changes during a run."""
+    with os.scandir(FIXTURES_DIR) as entries:
+        return {entry.name: Path(entry.path) for entry in entries if entry.is_file()}
+
+
+@pytest.fixture(scope="session")
+def fixture_paths():
+    """Map each fixture file name to its path, listed once per session."""
+    return _list_fixtures()
+
+
+@pytest.fixture(scope="session")
+def fixture_files(fixture_paths):
+    """Map each parseable (.py, .sql, .r) fixture file name to its path."""
+    return {
+        name: path for name, path in fixture_paths.items()
+        if path.suffix in SOURCE_SUFFIXES
+    }
+
+
+@lru_cache(maxsize=None)
+def _load_fixture_bytes():
+    """Read every fixture file once, reusing the cached directory listing."""
+    return {name: path.read_bytes() for name, path in _list_fixtures().items()}
+
+
+@lru_cache(maxsize=None)
+def _read_fixture_text(name: str) -> str:
+    """Decode a preloaded fixture file once."""
+    return _load_fixture_bytes()[name].decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def fixture_bytes():
+    """Provide the raw contents of every fixture file, keyed by file name."""
+    return _load_fixture_bytes()
+
+
+@pytest.fixture(scope="session")
+def read_fixture():
+    """Provide a cached reader for files in the fixtures directory."""
+    return _read_fixture_text
+
+
+@pytest.fixture(scope="session")
+def cassettes():
+    """Load recorded Anthropic responses once, keyed by file stem."""
+    return {
+        path.stem: json.loads(
+            path.read_text(encoding="utf-8"),
+            object_hook=lambda fields: SimpleNamespace(**fields)
+        )
+        for path in sorted(CASSETTE_DIR.glob("*.json"))
+    }
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Create one DocParser for the session; parsing keeps no state."""
+    return DocParser()
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """Create one DocValidator for the session; results depend only on the inputs."""
+    return DocValidator()
+
+
+@pytest.fixture(scope="session")
+def writer():
+    """Create one FileWriter for the session; writing keeps no state."""
+    return FileWriter()
+
+
+@lru_cache(maxsize=None)
+def _parse_cached(path_str: str, mtime_ns: int):
+    """Parse a fixture file once per (path, mtime); results are used read-only."""
+    return DocParser().parse(Path(path_str))
+
+
+@pytest.fixture(scope="session")
+def cached_parse():
+    """Parse read-only fixture files once per session, keyed by path and mtime."""
+    def _parse(file_path):
+        path_str = os.path.abspath(file_path)
+        return _parse_cached(path_str, os.stat(path_str).st_mtime_ns)
+
+    yield _parse
+    _parse_cached.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def parsed_fixtures(fixture_files, cached_parse):
+    """Parse every supported fixture file once, keyed by file name."""
+    return {name: cached_parse(path) for name, path in fixture_files.items()}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def patch_anthropic():
+    """Patch the Anthropic client class once per worker so no test reaches the API."""
+    with patch('docugen.core.doc_generator.Anthropic') as mock_anthropic:
+        mock_anthropic.return_value = Mock()
+        yield mock_anthropic
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Drop cached Anthropic clients so each test sees its own patched class."""
+    _get_client.cache_clear()
+    yield
+    _get_client.cache_clear()
@@ -4,41 +4,142 @@ Comprehensive tests for documentation parser module.
 
 import pytest
 from pathlib import Path
-from docugen.core.doc_parser import DocParser
+
+
+# Multi-line inputs for the in-memory parser tests
+_NUMPY_DOCSTRING = """
+        Short description here.
+
+        Longer description that spans
+        multiple lines.
+
+        Parameters
+        ----------
+        param1 : int
+            Description of param1
+        param2 : str, optional
+            Description of param2
+
+        Returns
+        -------
+        bool
+            Description of return value
+
+        Examples
+        --------
+        >>> func(1, 'test')
+        True
+        """
+
+_SQL_COMPLEX_QUERY = """-- # Complex Query
+--
+-- ## Description
+-- This is a complex query that does
+-- multiple things across several lines
+-- of description text.
+--
+-- ## Parameters
+-- - `start_date` (DATE): Beginning of date range
+-- - `end_date` (DATE): End of date range
+-- - `category` (VARCHAR): Product category filter
+--
+-- ## Returns
+-- - product_id (INT): Product identifier
+-- - total (DECIMAL): Sum of sales
+--
+-- ## Example
+-- ```sql
+-- SELECT * FROM products
+-- WHERE category = 'Electronics';
+-- ```
+
+SELECT * FROM products;
+"""
+
+_R_PROCESS_DATA = """#' Process Data
+#'
+#' This function processes input data according to specified rules.
+#'
+#' @param data A data frame containing the input data. This should
+#'   include columns x, y, and z. The data will be validated before
+#'   processing.
+#' @param options A list of processing options including method and
+#'   threshold values.
+#' @return A processed data frame with additional computed columns
+#' @examples
+#' result <- process_data(my_data, list(method = "standard"))
+#' @export
+process_data <- function(data, options) {
+  return(data)
+}
+"""
+
+_PY_MULTIPLY_LIST = '''def multiply_list(numbers):
+    """
+    Multiply all numbers in a list.
+
+    Parameters
+    ----------
+    numbers : list of int or float
+        List of numbers to multiply together
+
+    Returns
+    -------
+    int or float
+        Product of all numbers in the list
+
+    Raises
+    ------
+    ValueError
+        If the list is empty
+
+    Examples
+    --------
+    >>> multiply_list([2, 3, 4])
+    24
+    """
+    if not numbers:
+        raise ValueError("List cannot be empty")
+'''
+
+_CRLF_FUNC = 'def func():\r\n    """\r\n    Test function.\r\n\r\n    Returns\r\n    -------\r\n    None\r\n    """\r\n    pass'
+_LF_FUNC = 'def func():\n    """\n    Test function.\n\n    Returns\n    -------\n    None\n    """\n    pass'
+_MIXED_FUNC = 'def func():\r\n    """\n    Test function.\r\n\n    Returns\r\n    -------\n    None\r\n    """\n    pass'
+
+
+def _assert_fragments(result, expected):
+    """Assert each expected fragment (or tuple of fragments) is in its field."""
+    for field, fragments in expected.items():
+        if isinstance(fragments, str):
+            fragments = (fragments,)
+        for fragment in fragments:
+            assert fragment in result[field], f"{fragment!r} not in {field}"
 
 
 class TestDocParserPython:
     """Test suite for Python documentation parsing."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Get path to fixtures directory."""
-        return Path(__file__).parent / "fixtures"
+    DOCUMENTED = "python_documented.py"
+    INCOMPLETE = "python_incomplete.py"
+    UNDOCUMENTED = "python_undocumented.py"
 
-    def test_parse_documented_python(self, parser, fixtures_dir):
+    def test_parse_documented_python(self, cached_parse, fixture_paths):
         """Test parsing properly documented Python file."""
-        file_path = fixtures_dir / "python_documented.py"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.DOCUMENTED])
 
         assert result is not None
         assert result['name'] == 'add_numbers'
-        assert 'Add two numbers together' in result['description']
-        assert 'Parameters' in result['raw_doc']
-        assert 'a : int or float' in result['parameters']
-        assert 'b : int or float' in result['parameters']
-        assert 'int or float' in result['returns']
-        assert 'sum of a and b' in result['returns']
-        assert '>>> add_numbers(2, 3)' in result['examples']
-
-    def test_parse_incomplete_python(self, parser, fixtures_dir):
+        _assert_fragments(result, {
+            'description': 'Add two numbers together',
+            'raw_doc': 'Parameters',
+            'parameters': ('a : int or float', 'b : int or float'),
+            'returns': ('int or float', 'sum of a and b'),
+            'examples': '>>> add_numbers(2, 3)',
+        })
+
+    def test_parse_incomplete_python(self, cached_parse, fixture_paths):
         """Test parsing Python file with incomplete documentation."""
-        file_path = fixtures_dir / "python_incomplete.py"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.INCOMPLETE])
 
         assert result is not None
         assert result['name'] == 'calculate_area'
@@ -47,68 +148,36 @@ class TestDocParserPython:
         assert result['parameters'] is None
         assert result['returns'] is None
 
-    def test_parse_undocumented_python(self, parser, fixtures_dir):
+    def test_parse_undocumented_python(self, cached_parse, fixture_paths):
         """Test parsing Python file with no documentation."""
-        file_path = fixtures_dir / "python_undocumented.py"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.UNDOCUMENTED])
 
         # File has no docstrings, should return None
         assert result is None
 
-    def test_parse_python_with_raises(self, parser, fixtures_dir):
+    def test_parse_python_with_raises(self, parser):
         """Test parsing Python file with Raises section."""
-        file_path = fixtures_dir / "python_documented.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
+        result = parser._parse_python(_PY_MULTIPLY_LIST)
 
-        # Test the multiply_list function which has Raises section
-        result = parser._parse_python(content)
         assert result is not None
-        # The first function is parsed, but let's verify structure
-        assert result['name'] in ['add_numbers', 'multiply_list']
+        assert result['name'] == 'multiply_list'
+        assert 'ValueError' in result['raw_doc']
+        # Sections after Raises are still found
+        assert '>>> multiply_list([2, 3, 4])' in result['examples']
 
-    def test_parse_python_syntax_error(self, parser, tmp_path):
+    def test_parse_python_syntax_error(self, parser):
         """Test parsing Python file with syntax errors."""
-        test_file = tmp_path / "invalid.py"
-        test_file.write_text("def broken(\n    incomplete")
-
-        result = parser.parse(test_file)
+        result = parser.parse_string("def broken(\n    incomplete", ".py")
         assert result is None
 
-    def test_parse_python_no_docstring(self, parser, tmp_path):
+    def test_parse_python_no_docstring(self, parser):
         """Test parsing Python file with function but no docstring."""
-        test_file = tmp_path / "no_doc.py"
-        test_file.write_text("def func():\n    pass")
-
-        result = parser.parse(test_file)
+        result = parser.parse_string("def func():\n    pass", ".py")
         assert result is None
 
     def test_parse_numpy_docstring_sections(self, parser):
         """Test parsing all NumPy docstring sections."""
-        docstring = """
-        Short description here.
-
-        Longer description that spans
-        multiple lines.
-
-        Parameters
-        ----------
-        param1 : int
-            Description of param1
-        param2 : str, optional
-            Description of param2
-
-        Returns
-        -------
-        bool
-            Description of return value
-
-        Examples
-        --------
-        >>> func(1, 'test')
-        True
-        """
-        result = parser._parse_numpy_docstring('func', docstring)
+        result = parser._parse_numpy_docstring('func', _NUMPY_DOCSTRING)
 
         assert result['name'] == 'func'
         assert 'Short description' in result['description']
@@ -121,33 +190,26 @@ class TestDocParserPython:
 class TestDocParserSQL:
     """Test suite for SQL documentation parsing."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
+    DOCUMENTED = "sql_documented.sql"
+    INCOMPLETE = "sql_incomplete.sql"
+    UNDOCUMENTED = "sql_undocumented.sql"
 
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Get path to fixtures directory."""
-        return Path(__file__).parent / "fixtures"
-
-    def test_parse_documented_sql(self, parser, fixtures_dir):
+    def test_parse_documented_sql(self, cached_parse, fixture_paths):
         """Test parsing properly documented SQL file."""
-        file_path = fixtures_dir / "sql_documented.sql"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.DOCUMENTED])
 
         assert result is not None
         assert result['name'] == 'Calculate Customer Revenue'
-        assert 'calculates total revenue' in result['description']
-        assert 'None' in result['parameters']
-        assert 'customer_id' in result['returns']
-        assert 'INTEGER' in result['returns']
-        assert '```sql' in result['examples']
-
-    def test_parse_incomplete_sql(self, parser, fixtures_dir):
+        _assert_fragments(result, {
+            'description': 'calculates total revenue',
+            'parameters': 'None',
+            'returns': ('customer_id', 'INTEGER'),
+            'examples': '```sql',
+        })
+
+    def test_parse_incomplete_sql(self, cached_parse, fixture_paths):
         """Test parsing SQL file with incomplete documentation."""
-        file_path = fixtures_dir / "sql_incomplete.sql"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.INCOMPLETE])
 
         assert result is not None
         assert result['name'] == 'Get Active Users'
@@ -157,43 +219,15 @@ class TestDocParserSQL:
         assert result['returns'] is None
         assert result['examples'] is None
 
-    def test_parse_undocumented_sql(self, parser, fixtures_dir):
+    def test_parse_undocumented_sql(self, cached_parse, fixture_paths):
         """Test parsing SQL file with no documentation."""
-        file_path = fixtures_dir / "sql_undocumented.sql"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.UNDOCUMENTED])
 
         assert result is None
 
-    def test_parse_sql_multiline_sections(self, parser, tmp_path):
+    def test_parse_sql_multiline_sections(self, parser):
         """Test parsing SQL with multiline sections."""
-        sql_content = """-- # Complex Query
---
--- ## Description
--- This is a complex query that does
--- multiple things across several lines
--- of description text.
---
--- ## Parameters
--- - `start_date` (DATE): Beginning of date range
--- - `end_date` (DATE): End of date range
--- - `category` (VARCHAR): Product category filter
---
--- ## Returns
--- - product_id (INT): Product identifier
--- - total (DECIMAL): Sum of sales
---
--- ## Example
--- ```sql
--- SELECT * FROM products
--- WHERE category = 'Electronics';
--- ```
-
-SELECT * FROM products;
-"""
-        test_file = tmp_path / "test.sql"
-        test_file.write_text(sql_content)
-
-        result = parser.parse(test_file)
+        result = parser.parse_string(_SQL_COMPLEX_QUERY, ".sql")
 
         assert result is not None
         assert result['name'] == 'Complex Query'
@@ -203,45 +237,35 @@ SELECT * FROM products;
         assert 'product_id' in result['returns']
         assert 'Electronics' in result['examples']
 
-    def test_parse_sql_no_header(self, parser, tmp_path):
+    def test_parse_sql_no_header(self, parser):
         """Test parsing SQL file with comments but no markdown header."""
-        test_file = tmp_path / "no_header.sql"
-        test_file.write_text("-- Just a regular comment\nSELECT 1;")
-
-        result = parser.parse(test_file)
+        result = parser.parse_string("-- Just a regular comment\nSELECT 1;", ".sql")
         assert result is None
 
 
 class TestDocParserR:
     """Test suite for R documentation parsing."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
+    DOCUMENTED = "r_documented.r"
+    INCOMPLETE = "r_incomplete.r"
+    UNDOCUMENTED = "r_undocumented.r"
 
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Get path to fixtures directory."""
-        return Path(__file__).parent / "fixtures"
-
-    def test_parse_documented_r(self, parser, fixtures_dir):
+    def test_parse_documented_r(self, cached_parse, fixture_paths):
         """Test parsing properly documented R file."""
-        file_path = fixtures_dir / "r_documented.r"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.DOCUMENTED])
 
         assert result is not None
         assert result['name'] == 'calc_sd'
-        assert 'calculates the standard deviation' in result['description']
-        assert '@param x A numeric vector' in result['parameters']
-        assert '@param na.rm' in result['parameters']
-        assert 'numeric value representing' in result['returns']
-        assert 'calc_sd(data)' in result['examples']
-
-    def test_parse_incomplete_r(self, parser, fixtures_dir):
+        _assert_fragments(result, {
+            'description': 'calculates the standard deviation',
+            'parameters': ('@param x A numeric vector', '@param na.rm'),
+            'returns': 'numeric value representing',
+            'examples': 'calc_sd(data)',
+        })
+
+    def test_parse_incomplete_r(self, cached_parse, fixture_paths):
         """Test parsing R file with incomplete documentation."""
-        file_path = fixtures_dir / "r_incomplete.r"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.INCOMPLETE])
 
         assert result is not None
         assert result['name'] == 'sum_numbers'
@@ -250,45 +274,23 @@ class TestDocParserR:
         # Missing @return section
         assert result['returns'] is None
 
-    def test_parse_undocumented_r(self, parser, fixtures_dir):
+    def test_parse_undocumented_r(self, cached_parse, fixture_paths):
         """Test parsing R file with no documentation."""
-        file_path = fixtures_dir / "r_undocumented.r"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.UNDOCUMENTED])
 
         assert result is None
 
-    def test_parse_r_with_export(self, parser, fixtures_dir):
+    def test_parse_r_with_export(self, cached_parse, fixture_paths):
         """Test parsing R file with @export tag."""
-        file_path = fixtures_dir / "r_documented.r"
-        result = parser.parse(file_path)
+        result = cached_parse(fixture_paths[self.DOCUMENTED])
 
         assert result is not None
         # @export tag should be present in raw_doc but not interfere with parsing
         assert '@export' in result['raw_doc']
 
-    def test_parse_r_multiline_param(self, parser, tmp_path):
+    def test_parse_r_multiline_param(self, parser):
         """Test parsing R file with multiline parameter descriptions."""
-        r_content = """#' Process Data
-#'
-#' This function processes input data according to specified rules.
-#'
-#' @param data A data frame containing the input data. This should
-#'   include columns x, y, and z. The data will be validated before
-#'   processing.
-#' @param options A list of processing options including method and
-#'   threshold values.
-#' @return A processed data frame with additional computed columns
-#' @examples
-#' result <- process_data(my_data, list(method = "standard"))
-#' @export
-process_data <- function(data, options) {
-  return(data)
-}
-"""
-        test_file = tmp_path / "test.r"
-        test_file.write_text(r_content)
-
-        result = parser.parse(test_file)
+        result = parser.parse_string(_R_PROCESS_DATA, ".r")
 
         assert result is not None
         assert result['name'] == 'process_data'
@@ -298,7 +300,7 @@ process_data <- function(data, options) {
         assert '@param options' in result['parameters']
         assert 'processed data frame' in result['returns']
 
-    def test_parse_r_no_function_name(self, parser, tmp_path):
+    def test_parse_r_no_function_name(self, parser):
         """Test parsing R file where function name can't be extracted."""
         r_content = """#' Some Documentation
 #'
@@ -308,10 +310,7 @@ process_data <- function(data, options) {
 # Not a function definition
 x <- 5
 """
-        test_file = tmp_path / "test.r"
-        test_file.write_text(r_content)
-
-        result = parser.parse(test_file)
+        result = parser.parse_string(r_content, ".r")
 
         assert result is not None
         # Function name should be None if not found
@@ -321,102 +320,80 @@ x <- 5
 class TestDocParserGeneral:
     """Test suite for general parser functionality."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    def test_parse_nonexistent_file(self, parser, tmp_path):
+    def test_parse_nonexistent_file(self, parser, fs):
         """Test parsing file that doesn't exist."""
-        file_path = tmp_path / "nonexistent.py"
-        result = parser.parse(file_path)
+        result = parser.parse(Path("/project/nonexistent.py"))
         assert result is None
 
-    def test_parse_unsupported_extension(self, parser, tmp_path):
+    def test_parse_unsupported_extension(self, parser, fs):
         """Test parsing file with unsupported extension."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Some text")
+        fs.create_file("/project/test.txt", contents="Some text")
 
-        result = parser.parse(test_file)
+        result = parser.parse(Path("/project/test.txt"))
         assert result is None
 
-    def test_parse_unreadable_file(self, parser, tmp_path):
+    def test_parse_unreadable_file(self, parser, tmp_path, monkeypatch):
         """Test parsing file with read errors."""
         test_file = tmp_path / "test.py"
         test_file.write_text("def func(): pass")
 
-        # Make file unreadable on Unix systems
-        import os
-        try:
-            os.chmod(test_file, 0o000)
-            result = parser.parse(test_file)
-            assert result is None
-        finally:
-            # Restore permissions for cleanup
-            os.chmod(test_file, 0o644)
-
-    def test_parse_empty_file(self, parser, tmp_path):
-        """Test parsing empty file."""
-        test_file = tmp_path / "empty.py"
-        test_file.write_text("")
+        def raising_open(*args, **kwargs):
+            raise PermissionError("Permission denied")
 
-        result = parser.parse(test_file)
-        assert result is None
+        # Shadow open() for the parser module only
+        monkeypatch.setattr("docugen.core.doc_parser.open", raising_open, raising=False)
+        assert parser.parse(test_file) is None
 
-    def test_parse_binary_file(self, parser, tmp_path):
-        """Test parsing binary file with .py extension."""
-        test_file = tmp_path / "binary.py"
-        test_file.write_bytes(b'\x00\x01\x02\x03\xff\xfe')
+    def test_parse_string_matches_parse(self, parser, read_fixture, fixture_paths):
+        """Test in-memory parsing gives the same result as parsing the file."""
+        content = read_fixture("sql_documented.sql")
 
-        result = parser.parse(test_file)
-        # Should handle gracefully
-        assert result is None or result is not None  # Either outcome is acceptable
+        assert parser.parse_string(content, ".SQL") == parser.parse(fixture_paths["sql_documented.sql"])
+        assert parser.parse_string(content, ".txt") is None
 
+    def test_parse_bytes_matches_parse(self, parser, fixture_bytes, fixture_paths):
+        """Test parsing preloaded bytes gives the same result as parsing each fixture file."""
+        for name, data in fixture_bytes.items():
+            suffix = Path(name).suffix
+            assert parser.parse_bytes(data, suffix) == parser.parse(fixture_paths[name]), name
 
-class TestDocParserCrossPlatform:
-    """Test suite for cross-platform compatibility."""
+    def test_parse_bytes_invalid_utf8(self, parser):
+        """Test undecodable bytes are treated as having no documentation."""
+        assert parser.parse_bytes(b'\x00\x01\xff\xfe', ".py") is None
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
+    @pytest.mark.parametrize("suffix", [".py", ".sql", ".r"])
+    @pytest.mark.parametrize("content", ["", "\n  \r\n\t"], ids=["empty", "blank"])
+    def test_parse_empty_file(self, parser, suffix, content):
+        """Test parsing empty or whitespace-only content in every language."""
+        assert parser.parse_string(content, suffix) is None
 
-    def test_parse_windows_line_endings(self, parser, tmp_path):
-        """Test parsing files with Windows (CRLF) line endings."""
-        content = 'def func():\r\n    """\r\n    Test function.\r\n\r\n    Returns\r\n    -------\r\n    None\r\n    """\r\n    pass'
-        test_file = tmp_path / "windows.py"
-        test_file.write_text(content)
+    def test_parse_binary_file(self, parser, fs):
+        """Test parsing binary file with .py extension."""
+        fs.create_file("/project/binary.py", contents=b'\x00\x01\x02\x03\xff\xfe')
 
-        result = parser.parse(test_file)
-        assert result is not None
-        assert result['name'] == 'func'
+        # Undecodable content is treated as having no documentation
+        assert parser.parse(Path("/project/binary.py")) is None
 
-    def test_parse_unix_line_endings(self, parser, tmp_path):
-        """Test parsing files with Unix (LF) line endings."""
-        content = 'def func():\n    """\n    Test function.\n\n    Returns\n    -------\n    None\n    """\n    pass'
-        test_file = tmp_path / "unix.py"
-        test_file.write_text(content)
 
-        result = parser.parse(test_file)
-        assert result is not None
-        assert result['name'] == 'func'
+class TestDocParserCrossPlatform:
+    """Test suite for cross-platform compatibility."""
 
-    def test_parse_mixed_line_endings(self, parser, tmp_path):
-        """Test parsing files with mixed line endings."""
-        content = 'def func():\r\n    """\n    Test function.\r\n\n    Returns\r\n    -------\n    None\r\n    """\n    pass'
-        test_file = tmp_path / "mixed.py"
-        test_file.write_text(content, newline='')
+    @pytest.mark.parametrize("content", [_CRLF_FUNC, _LF_FUNC, _MIXED_FUNC],
+                             ids=["crlf", "lf", "mixed"])
+    def test_parse_line_endings(self, parser, fs, content):
+        """Test parsing files with Windows, Unix, and mixed line endings."""
+        # Bytes so the line endings on disk are exactly as given
+        fs.create_file("/project/endings.py", contents=content.encode())
 
-        result = parser.parse(test_file)
+        result = parser.parse(Path("/project/endings.py"))
         assert result is not None
+        assert result['name'] == 'func'
 
-    def test_parse_path_with_spaces(self, parser, tmp_path):
+    def test_parse_path_with_spaces(self, parser, fs):
         """Test parsing files in directories with spaces."""
-        dir_with_spaces = tmp_path / "my test dir"
-        dir_with_spaces.mkdir()
-        test_file = dir_with_spaces / "test.py"
-        test_file.write_text('def func():\n    """Test."""\n    pass')
+        test_file = Path("/project/my test dir/test.py")
+        fs.create_file(test_file, contents='def func():\n    """Test."""\n    pass')
 
         result = parser.parse(test_file)
-        # Should handle paths with spaces correctly
-        assert result is not None or result is None  # Implementation dependent
\ No newline at end of file
+        assert result is not None
+        assert result['name'] == 'func'
@@ -2,10 +2,62 @@
 Comprehensive tests for documentation validator module.
 """
 
-import pytest
+import re
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import patch
+
+import pytest
 from docugen.core.doc_validator import DocValidator, ValidationResult
-from docugen.core.doc_parser import DocParser
+
+
+# Keep validator tests on one xdist worker so they share its session fixtures and caches
+pytestmark = pytest.mark.xdist_group(name="validator")
+
+# Validation only looks at the suffix, so these paths never touch the disk
+_DUMMY_PY = Path("dummy/test.py")
+_DUMMY_SQL = Path("dummy/test.sql")
+_DUMMY_R = Path("dummy/test.r")
+_DUMMY_TXT = Path("dummy/test.txt")
+
+# Valid documents per language; tests derive variants with {**base, field: value}
+_BASE_PY_DOC = MappingProxyType({
+    'name': 'func',
+    'description': 'A proper description here',
+    'parameters': 'x : int',
+    'returns': 'int\n    Result',
+    'raw_doc': '"""\nA proper description here\n\nParameters\n----------\nx : int\n\nReturns\n-------\nint\n    Result\n"""'
+})
+_BASE_SQL_DOC = MappingProxyType({
+    'name': 'Query',
+    'description': 'A proper description of the query',
+    'parameters': '- None',
+    'returns': '- result (INT)',
+    'examples': 'SELECT 1',
+    'raw_doc': '-- # Query\n-- ## Description\n-- A proper description\n-- ## Parameters\n-- - None\n-- ## Returns\n-- - result (INT)\n-- ## Example\n-- SELECT 1'
+})
+_BASE_R_DOC = MappingProxyType({
+    'name': 'func',
+    'description': 'A proper description of the function',
+    'parameters': '@param x A numeric value',
+    'returns': 'A result',
+    'raw_doc': "#' A proper description of the function\n#' @param x A numeric value\n#' @return A result"
+})
+
+
+@pytest.fixture(scope="session", params=[
+    (_DUMMY_SQL, _BASE_SQL_DOC),
+    (_DUMMY_PY, _BASE_PY_DOC),
+    (_DUMMY_R, _BASE_R_DOC),
+], ids=["sql", "python", "r"])
+def minimal_valid_doc(request):
+    """Provide a (path, valid doc) pair for each supported language."""
+    return request.param
+
+
+def _issues_text(result):
+    """Join all issues into one string so each assertion is a single substring search."""
+    return " | ".join(result.issues)
 
 
 class TestValidationResult:
@@ -27,319 +79,122 @@ class TestValidationResult:
         assert "INVALID" in repr(result)
         assert "2 issues" in repr(result)
 
+    def test_validation_result_issues_immutable(self):
+        """Test issues are stored as a tuple and no instance dict exists."""
+        issues = ["Missing description"]
+        result = ValidationResult(False, issues)
+        issues.append("No parameters")
+
+        assert result.issues == ("Missing description",)
+        with pytest.raises(AttributeError):
+            result.extra = True
+
     def test_validation_result_empty_issues(self):
         """Test ValidationResult with empty issues list."""
         result = ValidationResult(True, [])
         assert result.is_valid is True
-        assert result.issues == []
-
-
-class TestDocValidatorPython:
-    """Test suite for Python documentation validation."""
+        assert result.issues == ()
 
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
-
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Get path to fixtures directory."""
-        return Path(__file__).parent / "fixtures"
-
-    def test_validate_documented_python(self, validator, parser, fixtures_dir):
-        """Test validating properly documented Python file."""
-        file_path = fixtures_dir / "python_documented.py"
-        doc = parser.parse(file_path)
-        result = validator.validate(file_path, doc)
 
-        assert result.is_valid is True
-        assert len(result.issues) == 0
+# Issue patterns expected for the incomplete fixtures, compiled once
+_RX_MISSING = re.compile(r"[Mm]issing")
+_RX_RETURN_TAG = re.compile(r"@return")
 
-    def test_validate_incomplete_python(self, validator, parser, fixtures_dir):
-        """Test validating Python file with incomplete documentation."""
-        file_path = fixtures_dir / "python_incomplete.py"
-        doc = parser.parse(file_path)
-        result = validator.validate(file_path, doc)
+# (fixture prefix, extension, pattern expected in an incomplete-doc issue)
+LANGUAGES = [
+    pytest.param("python", ".py", _RX_MISSING, id="python"),
+    pytest.param("sql", ".sql", _RX_MISSING, id="sql"),
+    pytest.param("r", ".r", _RX_RETURN_TAG, id="r"),
+]
 
-        assert result.is_valid is False
-        assert len(result.issues) > 0
-        # Should have issues about missing sections
-        assert any("Missing" in issue or "missing" in issue for issue in result.issues)
 
-    def test_validate_undocumented_python(self, validator, fixtures_dir):
-        """Test validating Python file with no documentation."""
-        file_path = fixtures_dir / "python_undocumented.py"
-        result = validator.validate(file_path, None)
+@pytest.mark.parametrize("lang,ext,incomplete_issue", LANGUAGES)
+class TestDocValidatorFixtures:
+    """Test suite for validating the per-language fixture files."""
 
-        assert result.is_valid is False
-        assert "No documentation found" in result.issues
-
-    def test_validate_python_missing_name(self, validator, tmp_path):
-        """Test validating Python doc without function name."""
-        doc = {
-            'name': None,
-            'description': 'A description',
-            'parameters': 'x : int',
-            'returns': 'int',
-            'raw_doc': '"""\nDoc\n\nParameters\n----------\nx : int\n\nReturns\n-------\nint\n"""'
-        }
-        file_path = tmp_path / "test.py"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("name" in issue.lower() for issue in result.issues)
-
-    def test_validate_python_short_description(self, validator, tmp_path):
-        """Test validating Python doc with too short description."""
-        doc = {
-            'name': 'func',
-            'description': 'Short',  # Less than 10 characters
-            'parameters': 'x : int',
-            'returns': 'int',
-            'raw_doc': '"""\nShort\n\nParameters\n----------\nx : int\n\nReturns\n-------\nint\n"""'
-        }
-        file_path = tmp_path / "test.py"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("too short" in issue.lower() for issue in result.issues)
-
-    def test_validate_python_missing_parameters(self, validator, tmp_path):
-        """Test validating Python doc without Parameters section."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description here',
-            'parameters': None,
-            'returns': 'int',
-            'raw_doc': '"""\nA proper description here\n\nReturns\n-------\nint\n"""'
-        }
-        file_path = tmp_path / "test.py"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("Parameters" in issue for issue in result.issues)
-
-    def test_validate_python_missing_returns(self, validator, tmp_path):
-        """Test validating Python doc without Returns section."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description here',
-            'parameters': 'x : int',
-            'returns': None,
-            'raw_doc': '"""\nA proper description here\n\nParameters\n----------\nx : int\n"""'
-        }
-        file_path = tmp_path / "test.py"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("Returns" in issue for issue in result.issues)
-
-    def test_validate_python_empty_returns(self, validator, tmp_path):
-        """Test validating Python doc with empty Returns section."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description here',
-            'parameters': 'x : int',
-            'returns': '   ',
-            'raw_doc': '"""\nA proper description here\n\nParameters\n----------\nx : int\n\nReturns\n-------\n\n"""'
-        }
-        file_path = tmp_path / "test.py"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("Empty Returns" in issue for issue in result.issues)
-
-    def test_validate_python_bad_parameter_format(self, validator, tmp_path):
-        """Test validating Python doc with improperly formatted parameters."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description here',
-            'parameters': 'x is a number',  # Missing colon format
-            'returns': 'int\n    Description',
-            'raw_doc': '"""\nA proper description here\n\nParameters\n----------\nx is a number\n\nReturns\n-------\nint\n    Description\n"""'
-        }
-        file_path = tmp_path / "test.py"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("param_name : type" in issue for issue in result.issues)
-
-    def test_validate_python_missing_underlines(self, validator, tmp_path):
-        """Test validating Python doc without proper section underlines."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description here',
-            'parameters': 'x : int',
-            'returns': 'int',
-            'raw_doc': '"""\nA proper description here\n\nParameters\nx : int\n\nReturns\nint\n"""'
-        }
-        file_path = tmp_path / "test.py"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("underline" in issue.lower() for issue in result.issues)
-
-
-class TestDocValidatorSQL:
-    """Test suite for SQL documentation validation."""
-
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
-
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Get path to fixtures directory."""
-        return Path(__file__).parent / "fixtures"
-
-    def test_validate_documented_sql(self, validator, parser, fixtures_dir):
-        """Test validating properly documented SQL file."""
-        file_path = fixtures_dir / "sql_documented.sql"
-        doc = parser.parse(file_path)
-        result = validator.validate(file_path, doc)
+    def test_validate_documented(self, validator, cached_parse, fixture_paths,
+                                 lang, ext, incomplete_issue):
+        """Test validating a properly documented file."""
+        file_path = fixture_paths[f"{lang}_documented{ext}"]
+        result = validator.validate(file_path, cached_parse(file_path))
 
         assert result.is_valid is True
         assert len(result.issues) == 0
 
-    def test_validate_incomplete_sql(self, validator, parser, fixtures_dir):
-        """Test validating SQL file with incomplete documentation."""
-        file_path = fixtures_dir / "sql_incomplete.sql"
-        doc = parser.parse(file_path)
-        result = validator.validate(file_path, doc)
+    def test_validate_incomplete(self, validator, cached_parse, fixture_paths,
+                                 lang, ext, incomplete_issue):
+        """Test validating a file with incomplete documentation."""
+        file_path = fixture_paths[f"{lang}_incomplete{ext}"]
+        result = validator.validate(file_path, cached_parse(file_path))
 
         assert result.is_valid is False
         assert len(result.issues) > 0
         # Should have issues about missing sections
-        assert any("Missing" in issue or "missing" in issue for issue in result.issues)
+        assert incomplete_issue.search(_issues_text(result))
 
-    def test_validate_undocumented_sql(self, validator, fixtures_dir):
-        """Test validating SQL file with no documentation."""
-        file_path = fixtures_dir / "sql_undocumented.sql"
+    def test_validate_undocumented(self, validator, fixture_paths,
+                                   lang, ext, incomplete_issue):
+        """Test validating a file with no documentation."""
+        file_path = fixture_paths[f"{lang}_undocumented{ext}"]
         result = validator.validate(file_path, None)
 
         assert result.is_valid is False
         assert "No documentation found" in result.issues
 
-    def test_validate_sql_missing_name(self, validator, tmp_path):
-        """Test validating SQL doc without function name."""
-        doc = {
-            'name': None,
-            'description': 'A description of the query',
-            'parameters': '- param1 (INT)',
-            'returns': '- result (INT)',
-            'examples': 'SELECT 1',
-            'raw_doc': '-- ## Description\n-- A description'
-        }
-        file_path = tmp_path / "test.sql"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("name" in issue.lower() for issue in result.issues)
-
-    def test_validate_sql_short_description(self, validator, tmp_path):
-        """Test validating SQL doc with too short description."""
-        doc = {
-            'name': 'Query',
-            'description': 'Short',
-            'parameters': '- param1 (INT)',
-            'returns': '- result (INT)',
-            'examples': 'SELECT 1',
-            'raw_doc': '-- # Query\n--\n-- ## Description\n-- Short'
-        }
-        file_path = tmp_path / "test.sql"
-        result = validator.validate(file_path, doc)
 
-        assert result.is_valid is False
-        assert any("too short" in issue.lower() for issue in result.issues)
+class TestDocValidatorPython:
+    """Test suite for Python documentation validation."""
 
-    def test_validate_sql_missing_description(self, validator, tmp_path):
-        """Test validating SQL doc without Description section."""
-        doc = {
-            'name': 'Query',
-            'description': None,
-            'parameters': '- param1 (INT)',
-            'returns': '- result (INT)',
-            'examples': 'SELECT 1',
-            'raw_doc': '-- # Query'
-        }
-        file_path = tmp_path / "test.sql"
-        result = validator.validate(file_path, doc)
+    @pytest.mark.parametrize("mutation, expected", [
+        ({'name': None}, "name"),
+        ({'description': 'Short'}, "too short"),  # Less than 10 characters
+        ({'parameters': None}, "Parameters"),
+        ({'returns': None}, "Returns"),
+        ({'returns': '   '}, "Empty Returns"),
+        ({'parameters': 'x is a number'}, "param_name : type"),  # Missing colon format
+        ({'raw_doc': '"""\nA proper description here\n\nParameters\nx : int\n\nReturns\nint\n"""'},
+         "underline"),
+    ], ids=["missing_name", "short_description", "missing_parameters", "missing_returns",
+            "empty_returns", "bad_parameter_format", "missing_underlines"])
+    def test_validate_python_issue(self, validator, mutation, expected):
+        """Test validating Python doc with one field made invalid."""
+        doc = {**_BASE_PY_DOC, **mutation}
+        result = validator.validate(_DUMMY_PY, doc)
 
         assert result.is_valid is False
-        assert any("Description" in issue for issue in result.issues)
+        assert expected in _issues_text(result)
 
-    def test_validate_sql_missing_parameters(self, validator, tmp_path):
-        """Test validating SQL doc without Parameters section."""
-        doc = {
-            'name': 'Query',
-            'description': 'A proper description of the query',
-            'parameters': None,
-            'returns': '- result (INT)',
-            'examples': 'SELECT 1',
-            'raw_doc': '-- # Query\n-- ## Description\n-- A proper description'
-        }
-        file_path = tmp_path / "test.sql"
-        result = validator.validate(file_path, doc)
 
-        assert result.is_valid is False
-        assert any("parameters" in issue.lower() for issue in result.issues)
-
-    def test_validate_sql_missing_returns(self, validator, tmp_path):
-        """Test validating SQL doc without Returns section."""
-        doc = {
-            'name': 'Query',
-            'description': 'A proper description of the query',
-            'parameters': '- param1 (INT)',
-            'returns': None,
-            'examples': 'SELECT 1',
-            'raw_doc': '-- # Query\n-- ## Description\n-- A proper description'
-        }
-        file_path = tmp_path / "test.sql"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("returns" in issue.lower() for issue in result.issues)
+class TestDocValidatorSQL:
+    """Test suite for SQL documentation validation."""
 
-    def test_validate_sql_missing_example(self, validator, tmp_path):
-        """Test validating SQL doc without Example section."""
-        doc = {
-            'name': 'Query',
-            'description': 'A proper description of the query',
-            'parameters': '- param1 (INT)',
-            'returns': '- result (INT)',
-            'examples': None,
-            'raw_doc': '-- # Query\n-- ## Description\n-- A proper description'
-        }
-        file_path = tmp_path / "test.sql"
-        result = validator.validate(file_path, doc)
+    @pytest.mark.parametrize("mutation, expected", [
+        ({'name': None}, "name"),
+        ({'description': 'Short'}, "too short"),
+        ({'description': None}, "Description"),
+        ({'parameters': None}, "parameters"),
+        ({'returns': None}, "returns"),
+        ({'examples': None}, "example"),
+    ], ids=["missing_name", "short_description", "missing_description",
+            "missing_parameters", "missing_returns", "missing_example"])
+    def test_validate_sql_issue(self, validator, mutation, expected):
+        """Test validating SQL doc with one section made invalid."""
+        doc = {**_BASE_SQL_DOC, **mutation}
+        result = validator.validate(_DUMMY_SQL, doc)
 
         assert result.is_valid is False
-        assert any("example" in issue.lower() for issue in result.issues)
+        assert expected in _issues_text(result)
 
-    def test_validate_sql_empty_sections(self, validator, tmp_path):
+    def test_validate_sql_empty_sections(self, validator):
         """Test validating SQL doc with empty sections."""
         doc = {
-            'name': 'Query',
+            **_BASE_SQL_DOC,
             'description': '   ',
             'parameters': '',
             'returns': '   ',
-            'examples': '',
-            'raw_doc': '-- # Query\n-- ## Description\n--\n-- ## Parameters\n--'
+            'examples': ''
         }
-        file_path = tmp_path / "test.sql"
-        result = validator.validate(file_path, doc)
+        result = validator.validate(_DUMMY_SQL, doc)
 
         assert result.is_valid is False
         # Should have multiple empty section issues
@@ -350,267 +205,101 @@ class TestDocValidatorSQL:
 class TestDocValidatorR:
     """Test suite for R documentation validation."""
 
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
-
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Get path to fixtures directory."""
-        return Path(__file__).parent / "fixtures"
-
-    def test_validate_documented_r(self, validator, parser, fixtures_dir):
-        """Test validating properly documented R file."""
-        file_path = fixtures_dir / "r_documented.r"
-        doc = parser.parse(file_path)
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is True
-        assert len(result.issues) == 0
-
-    def test_validate_incomplete_r(self, validator, parser, fixtures_dir):
-        """Test validating R file with incomplete documentation."""
-        file_path = fixtures_dir / "r_incomplete.r"
-        doc = parser.parse(file_path)
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert len(result.issues) > 0
-        # Should have issues about missing sections
-        assert any("@return" in issue for issue in result.issues)
-
-    def test_validate_undocumented_r(self, validator, fixtures_dir):
-        """Test validating R file with no documentation."""
-        file_path = fixtures_dir / "r_undocumented.r"
-        result = validator.validate(file_path, None)
-
-        assert result.is_valid is False
-        assert "No documentation found" in result.issues
-
-    def test_validate_r_missing_name(self, validator, tmp_path):
-        """Test validating R doc without function name."""
-        doc = {
-            'name': None,
-            'description': 'A description of the function',
-            'parameters': '@param x A value',
-            'returns': 'A result',
-            'examples': 'func(x)',
-            'raw_doc': "#' A description\n#' @param x A value\n#' @return A result"
-        }
-        file_path = tmp_path / "test.r"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("name" in issue.lower() for issue in result.issues)
-
-    def test_validate_r_short_description(self, validator, tmp_path):
-        """Test validating R doc with too short description."""
-        doc = {
-            'name': 'func',
-            'description': 'Short',
-            'parameters': '@param x A numeric value',
-            'returns': 'A result',
-            'examples': 'func(x)',
-            'raw_doc': "#' Short\n#' @param x A value\n#' @return A result"
-        }
-        file_path = tmp_path / "test.r"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("too short" in issue.lower() for issue in result.issues)
-
-    def test_validate_r_missing_description(self, validator, tmp_path):
-        """Test validating R doc without description."""
-        doc = {
-            'name': 'func',
-            'description': None,
-            'parameters': '@param x A numeric value',
-            'returns': 'A result',
-            'examples': 'func(x)',
-            'raw_doc': "#' @param x A value\n#' @return A result"
-        }
-        file_path = tmp_path / "test.r"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("description" in issue.lower() for issue in result.issues)
-
-    def test_validate_r_missing_param_tags(self, validator, tmp_path):
-        """Test validating R doc without @param tags."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description of the function',
-            'parameters': None,
-            'returns': 'A result',
-            'examples': 'func(x)',
-            'raw_doc': "#' A proper description\n#' @return A result"
-        }
-        file_path = tmp_path / "test.r"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("@param" in issue for issue in result.issues)
-
-    def test_validate_r_missing_return_tag(self, validator, tmp_path):
-        """Test validating R doc without @return tag."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description of the function',
-            'parameters': '@param x A numeric value',
-            'returns': None,
-            'examples': 'func(x)',
-            'raw_doc': "#' A proper description\n#' @param x A value"
-        }
-        file_path = tmp_path / "test.r"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("@return" in issue for issue in result.issues)
-
-    def test_validate_r_empty_return(self, validator, tmp_path):
-        """Test validating R doc with empty @return section."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description of the function',
-            'parameters': '@param x A numeric value',
-            'returns': '   ',
-            'examples': 'func(x)',
-            'raw_doc': "#' A proper description\n#' @param x A value\n#' @return"
-        }
-        file_path = tmp_path / "test.r"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("Empty @return" in issue for issue in result.issues)
-
-    def test_validate_r_bad_param_format(self, validator, tmp_path):
-        """Test validating R doc with parameters not using @param format."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description of the function',
-            'parameters': 'x is a value',  # Missing @param tag
-            'returns': 'A result',
-            'examples': 'func(x)',
-            'raw_doc': "#' A proper description\n#' x is a value\n#' @return A result"
-        }
-        file_path = tmp_path / "test.r"
-        result = validator.validate(file_path, doc)
-
-        assert result.is_valid is False
-        assert any("@param tag" in issue for issue in result.issues)
-
-    def test_validate_r_line_without_marker(self, validator, tmp_path):
-        """Test validating R doc with lines not starting with #'."""
-        doc = {
-            'name': 'func',
-            'description': 'A proper description of the function',
-            'parameters': '@param x A numeric value',
-            'returns': 'A result',
-            'examples': 'func(x)',
-            'raw_doc': "#' A proper description\n@param x A value\n#' @return A result"
-        }
-        file_path = tmp_path / "test.r"
-        result = validator.validate(file_path, doc)
+    @pytest.mark.parametrize("mutation, expected", [
+        ({'name': None}, "name"),
+        ({'description': 'Short'}, "too short"),
+        ({'description': None}, "description"),
+        ({'parameters': None}, "@param"),
+        ({'returns': None}, "@return"),
+        ({'returns': '   '}, "Empty @return"),
+        ({'parameters': 'x is a value'}, "@param tag"),  # Missing @param tag
+        ({'raw_doc': "#' A proper description\n@param x A value\n#' @return A result"},
+         "does not start with #'"),
+    ], ids=["missing_name", "short_description", "missing_description", "missing_param_tags",
+            "missing_return_tag", "empty_return", "bad_param_format", "line_without_marker"])
+    def test_validate_r_issue(self, validator, mutation, expected):
+        """Test validating R doc with one field made invalid."""
+        doc = {**_BASE_R_DOC, **mutation}
+        result = validator.validate(_DUMMY_R, doc)
 
         assert result.is_valid is False
-        assert any("does not start with #'" in issue for issue in result.issues)
+        assert expected in _issues_text(result)
 
 
 class TestDocValidatorGeneral:
     """Test suite for general validator functionality."""
 
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
-
-    def test_validate_none_documentation(self, validator, tmp_path):
+    def test_validate_none_documentation(self, validator):
         """Test validating with None documentation."""
-        file_path = tmp_path / "test.py"
+        file_path = _DUMMY_PY
         result = validator.validate(file_path, None)
 
         assert result.is_valid is False
         assert "No documentation found" in result.issues
+        # The result is shared regardless of file type
+        assert validator.validate(_DUMMY_TXT, None) is result
 
-    def test_validate_unsupported_file_type(self, validator, tmp_path):
+    def test_validate_unsupported_file_type(self, validator):
         """Test validating file with unsupported extension."""
-        file_path = tmp_path / "test.txt"
+        file_path = _DUMMY_TXT
         doc = {'name': 'test'}
         result = validator.validate(file_path, doc)
 
         assert result.is_valid is False
-        assert any("Unsupported file type" in issue for issue in result.issues)
+        assert "Unsupported file type" in _issues_text(result)
 
-    def test_validate_different_file_types(self, validator, tmp_path):
+    def test_validate_different_file_types(self, validator, minimal_valid_doc):
         """Test that validator routes to correct language validator."""
-        # Valid minimal docs for each language
-        sql_doc = {
-            'name': 'Query',
-            'description': 'A proper description of the query',
-            'parameters': '- None',
-            'returns': '- result (INT)',
-            'examples': 'SELECT 1',
-            'raw_doc': '-- # Query\n-- ## Description\n-- A proper description\n-- ## Parameters\n-- - None\n-- ## Returns\n-- - result (INT)\n-- ## Example\n-- SELECT 1'
-        }
+        file_path, doc = minimal_valid_doc
+        result = validator.validate(file_path, doc)
 
-        python_doc = {
-            'name': 'func',
-            'description': 'A proper description here',
-            'parameters': 'x : int',
-            'returns': 'int\n    Result',
-            'raw_doc': '"""\nA proper description here\n\nParameters\n----------\nx : int\n\nReturns\n-------\nint\n    Result\n"""'
-        }
+        # Each should be valid for its type
+        assert result.is_valid is True
 
-        r_doc = {
-            'name': 'func',
-            'description': 'A proper description of the function',
-            'parameters': '@param x A numeric value',
-            'returns': 'A result',
-            'raw_doc': "#' A proper description of the function\n#' @param x A numeric value\n#' @return A result"
-        }
 
-        sql_result = validator.validate(tmp_path / "test.sql", sql_doc)
-        py_result = validator.validate(tmp_path / "test.py", python_doc)
-        r_result = validator.validate(tmp_path / "test.r", r_doc)
+class TestDocValidatorCache:
+    """Test suite for memoized validation."""
 
-        # Each should be valid for its type
-        assert sql_result.is_valid is True
-        assert py_result.is_valid is True
-        assert r_result.is_valid is True
+    def test_validate_repeated_doc_uses_cache(self):
+        """Test identical documentation is validated once and issues stay immutable."""
+        validator = DocValidator()
+        doc = {**_BASE_PY_DOC, 'returns': None}
+        with patch.object(validator, '_validate_python', wraps=validator._validate_python) as spy:
+            first = validator.validate(_DUMMY_PY, doc)
+            second = validator.validate(_DUMMY_PY, dict(doc))
+
+        assert spy.call_count == 1
+        assert second.issues == first.issues
+        assert isinstance(second.issues, tuple)
+
+    def test_validate_absent_raw_doc(self, validator):
+        """Test an absent raw_doc is still validated as an empty docstring."""
+        doc = {key: value for key, value in _BASE_PY_DOC.items() if key != 'raw_doc'}
+        result = validator.validate(_DUMMY_PY, doc)
+
+        assert result.is_valid is False
+        assert "NumPy docstring" in _issues_text(result)
+
+    def test_validate_unhashable_fields(self, validator):
+        """Test documentation with unhashable values is validated without caching."""
+        doc = {**_BASE_R_DOC, 'examples': ['func(1)']}
+        result = validator.validate(_DUMMY_R, doc)
+
+        assert result.is_valid is True
 
 
 class TestDocValidatorCrossPlatform:
     """Test suite for cross-platform compatibility."""
 
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
-
-    def test_validate_windows_paths(self, validator, tmp_path):
+    def test_validate_windows_paths(self, validator):
         """Test validation with Path objects (works on all platforms)."""
-        file_path = tmp_path / "test.py"
-        doc = {
-            'name': 'func',
-            'description': 'A proper description here',
-            'parameters': 'x : int',
-            'returns': 'int\n    Result',
-            'raw_doc': '"""\nA proper description here\n\nParameters\n----------\nx : int\n\nReturns\n-------\nint\n    Result\n"""'
-        }
-
-        result = validator.validate(file_path, doc)
+        result = validator.validate(_DUMMY_PY, _BASE_PY_DOC)
         # Should work regardless of platform
         assert isinstance(result, ValidationResult)
 
-    def test_validate_with_unicode_content(self, validator, tmp_path):
+    def test_validate_with_unicode_content(self, validator):
         """Test validation with unicode characters in documentation."""
-        file_path = tmp_path / "test.py"
+        file_path = _DUMMY_PY
         doc = {
             'name': 'calculate_pi',
             'description': 'Calculate pi (3.14159) to specified precision',
@@ -40,4 +40,41 @@ def test_filter_unsupported_extensions(tmp_path):
     files = discovery.discover(tmp_path)
 
     assert len(files) == 1
-    assert files[0].suffix == '.py'
\ No newline at end of file
+    assert files[0].suffix == '.py'
+
+
+def test_discover_nested_directories(tmp_path):
+    """Test discovering files in subdirectories with mixed-case extensions."""
+    nested = tmp_path / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    (tmp_path / "top.py").write_text("# top")
+    (nested / "analysis.R").write_text("# analysis")
+    (nested / "notes.txt").write_text("ignore")
+    (tmp_path / "pkg" / "queries.sql").mkdir()
+
+    discovery = FileDiscovery()
+    files = discovery.discover(tmp_path)
+
+    assert sorted(files) == sorted([tmp_path / "top.py", nested / "analysis.R"])
+
+
+def test_discover_missing_directory(tmp_path):
+    """Test discovering in a directory that does not exist."""
+    discovery = FileDiscovery()
+    assert discovery.discover(tmp_path / "missing") == []
+
+
+def test_discover_directory_removed_during_walk(tmp_path):
+    """Test a subdirectory removed mid-walk is skipped."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (tmp_path / "top.py").write_text("# top")
+    (sub / "inner.py").write_text("# inner")
+
+    walk = FileDiscovery()._walk(str(tmp_path))
+    first = next(walk)
+    (sub / "inner.py").unlink()
+    sub.rmdir()
+
+    assert first == str(tmp_path / "top.py")
+    assert list(walk) == []
@@ -2,34 +2,32 @@
 Comprehensive tests for file writer module.
 """
 
+import errno
+import os
+
 import pytest
 from pathlib import Path
-from docugen.core.file_writer import FileWriter
+from docugen.core.file_writer import _split_path
 
 
 class TestFileWriterWrite:
     """Test suite for file writing functionality."""
 
-    @pytest.fixture
-    def writer(self):
-        """Create a FileWriter instance."""
-        return FileWriter()
-
     def test_write_creates_file(self, writer, tmp_path):
         """Test that write creates a new file."""
         original = tmp_path / "test.py"
-        original.write_text("original content")
+        original.write_bytes(b"original content")
 
         content = "modified content"
         new_path = writer.write(original, content, "_modified")
 
         assert new_path.exists()
-        assert new_path.read_text() == "modified content"
+        assert new_path.read_bytes() == b"modified content"
 
     def test_write_adds_suffix(self, writer, tmp_path):
         """Test that write adds suffix to filename."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "new content", "_modified")
 
@@ -39,7 +37,7 @@ class TestFileWriterWrite:
     def test_write_preserves_extension(self, writer, tmp_path):
         """Test that write preserves file extension."""
         original = tmp_path / "script.sql"
-        original.write_text("SELECT 1;")
+        original.write_bytes(b"SELECT 1;")
 
         new_path = writer.write(original, "SELECT 2;", "_new")
 
@@ -49,7 +47,7 @@ class TestFileWriterWrite:
     def test_write_returns_path(self, writer, tmp_path):
         """Test that write returns the path to new file."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         result = writer.write(original, "new", "_suffix")
 
@@ -59,31 +57,106 @@ class TestFileWriterWrite:
     def test_write_overwrites_existing(self, writer, tmp_path):
         """Test that write overwrites existing file with same name."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         # Create file with target name
         target = tmp_path / "test_modified.py"
-        target.write_text("old modified")
+        target.write_bytes(b"old modified")
 
         # Write should overwrite
         new_path = writer.write(original, "new modified", "_modified")
 
-        assert new_path.read_text() == "new modified"
+        assert new_path.read_bytes() == b"new modified"
+
+    @pytest.mark.parametrize("chunks, expected", [
+        ([b"-- # Query\n", memoryview(b"SELECT 1;\n"), bytearray()], b"-- # Query\nSELECT 1;\n"),
+        ([b"x"] * 2000, b"x" * 2000),
+    ], ids=["mixed", "over_iov_max"])
+    @pytest.mark.parametrize("writev", [True, False], ids=["writev", "joined"])
+    def test_write_chunks(self, writer, tmp_path, monkeypatch, writev, chunks, expected):
+        """Test writing a file from separate buffers, including more than IOV_MAX."""
+        original = tmp_path / "query.sql"
+        original.write_bytes(b"SELECT 1;")
+        if not writev:
+            monkeypatch.delattr(os, "writev", raising=False)
+
+        new_path = writer.write_chunks(original, chunks, "_documented")
+
+        assert new_path.name == "query_documented.sql"
+        assert new_path.read_bytes() == expected
+
+    @pytest.mark.parametrize("max_workers", [None, 1, 4])
+    def test_write_many_preserves_order(self, writer, tmp_path, max_workers):
+        """Test threaded and inline bulk writes return paths in job order."""
+        jobs = []
+        for i in range(10):
+            original = tmp_path / f"file{i}.py"
+            original.write_bytes(b"original")
+            jobs.append((original, f"content {i}", "_new"))
+
+        new_paths = writer.write_many(jobs, max_workers=max_workers)
+
+        assert [p.name for p in new_paths] == [f"file{i}_new.py" for i in range(10)]
+        assert [p.read_text() for p in new_paths] == [f"content {i}" for i in range(10)]
+
+    def test_write_many_shared_directories(self, writer, tmp_path, monkeypatch):
+        """Test bulk writes into shared, single-use and relative directories."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        monkeypatch.chdir(tmp_path)
+        jobs = [
+            (shared / "a.py", "a", "_new"),
+            (shared / "b.sql", "b", "_new"),
+            (tmp_path / "c.r", "c", "_new"),
+            (Path("d.py"), "d", "_new"),
+            (Path("e.py"), "e", "_new"),
+        ]
+
+        new_paths = writer.write_many(jobs, max_workers=1)
+
+        assert new_paths == [shared / "a_new.py", shared / "b_new.sql", tmp_path / "c_new.r",
+                             Path("d_new.py"), Path("e_new.py")]
+        assert [p.read_bytes() for p in new_paths] == [b"a", b"b", b"c", b"d", b"e"]
+
+    @pytest.mark.parametrize("convert", [bytes, bytearray, memoryview])
+    def test_write_bytes_content(self, writer, tmp_path, convert):
+        """Test bytes-like content is written without re-encoding."""
+        original = tmp_path / "test.py"
+        original.write_bytes(b"original")
+        data = "# Ünïcödé\r\n".encode("utf-8")
+
+        new_path = writer.write(original, convert(data), "_modified")
+
+        assert new_path.read_bytes() == data
+
+    def test_write_many(self, writer, tmp_path):
+        """Test writing several files in one call."""
+        originals = [tmp_path / "a.py", tmp_path / "b.sql"]
+        for original in originals:
+            original.write_bytes(b"original")
+
+        new_paths = writer.write_many([
+            (originals[0], "new a", "_documented"),
+            (originals[1], "new b", "_documented"),
+        ])
+
+        assert [p.name for p in new_paths] == ["a_documented.py", "b_documented.sql"]
+        assert [p.read_bytes() for p in new_paths] == [b"new a", b"new b"]
 
     def test_write_with_empty_content(self, writer, tmp_path):
         """Test writing empty content."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "", "_empty")
 
         assert new_path.exists()
-        assert new_path.read_text() == ""
+        assert new_path.read_bytes() == b""
 
     def test_write_with_unicode_content(self, writer, tmp_path):
         """Test writing unicode content."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         content = "def calculate_pi():\n    '''Calculate pi value'''\n    return 3.14159"
         new_path = writer.write(original, content, "_unicode")
@@ -94,7 +167,7 @@ class TestFileWriterWrite:
     def test_write_preserves_newlines(self, writer, tmp_path):
         """Test that write preserves newline characters."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         content = "line1\nline2\nline3"
         new_path = writer.write(original, content, "_newlines")
@@ -105,8 +178,8 @@ class TestFileWriterWrite:
         """Test writing multiple files in same directory."""
         file1 = tmp_path / "test1.py"
         file2 = tmp_path / "test2.py"
-        file1.write_text("content1")
-        file2.write_text("content2")
+        file1.write_bytes(b"content1")
+        file2.write_bytes(b"content2")
 
         path1 = writer.write(file1, "modified1", "_new")
         path2 = writer.write(file2, "modified2", "_new")
@@ -119,45 +192,38 @@ class TestFileWriterWrite:
     def test_write_different_suffixes(self, writer, tmp_path):
         """Test writing same file with different suffixes."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         path1 = writer.write(original, "version1", "_v1")
         path2 = writer.write(original, "version2", "_v2")
 
         assert path1.name == "test_v1.py"
         assert path2.name == "test_v2.py"
-        assert path1.read_text() == "version1"
-        assert path2.read_text() == "version2"
+        assert path1.read_bytes() == b"version1"
+        assert path2.read_bytes() == b"version2"
 
     def test_write_with_complex_suffix(self, writer, tmp_path):
         """Test writing with complex suffix."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "content", "_documented_2024")
 
         assert new_path.name == "test_documented_2024.py"
 
-    def test_write_sql_file(self, writer, tmp_path):
-        """Test writing SQL file."""
-        original = tmp_path / "query.sql"
-        original.write_text("SELECT 1;")
-
-        content = "-- Documentation\nSELECT 1;"
-        new_path = writer.write(original, content, "_documented")
-
-        assert new_path.suffix == ".sql"
-        assert new_path.read_text() == content
-
-    def test_write_r_file(self, writer, tmp_path):
-        """Test writing R file."""
-        original = tmp_path / "script.r"
-        original.write_text("func <- function() {}")
+    @pytest.mark.parametrize("name, content", [
+        ("module.py", '"""Documentation"""\ndef func(): pass'),
+        ("query.sql", "-- Documentation\nSELECT 1;"),
+        ("script.r", "#' Documentation\nfunc <- function() {}"),
+    ], ids=["python", "sql", "r"])
+    def test_write_preserves_file_type(self, writer, tmp_path, name, content):
+        """Test writing each supported file type keeps its extension and content."""
+        original = tmp_path / name
+        original.write_bytes(b"original")
 
-        content = "#' Documentation\nfunc <- function() {}"
         new_path = writer.write(original, content, "_documented")
 
-        assert new_path.suffix == ".r"
+        assert new_path.suffix == original.suffix
         assert new_path.read_text() == content
 
     def test_write_file_in_subdirectory(self, writer, tmp_path):
@@ -165,7 +231,7 @@ class TestFileWriterWrite:
         subdir = tmp_path / "subdir"
         subdir.mkdir()
         original = subdir / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "modified", "_new")
 
@@ -175,7 +241,7 @@ class TestFileWriterWrite:
     def test_write_long_content(self, writer, tmp_path):
         """Test writing long content."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         # Create long content
         content = "# Header\n" + ("line\n" * 1000)
@@ -187,25 +253,20 @@ class TestFileWriterWrite:
 class TestFileWriterBackup:
     """Test suite for backup functionality."""
 
-    @pytest.fixture
-    def writer(self):
-        """Create a FileWriter instance."""
-        return FileWriter()
-
     def test_backup_creates_file(self, writer, tmp_path):
         """Test that backup creates a backup file."""
         original = tmp_path / "test.py"
-        original.write_text("original content")
+        original.write_bytes(b"original content")
 
         backup_path = writer.backup(original)
 
         assert backup_path.exists()
-        assert backup_path.read_text() == "original content"
+        assert backup_path.read_bytes() == b"original content"
 
     def test_backup_adds_extension(self, writer, tmp_path):
         """Test that backup adds .backup extension."""
         original = tmp_path / "test.py"
-        original.write_text("content")
+        original.write_bytes(b"content")
 
         backup_path = writer.backup(original)
 
@@ -224,7 +285,7 @@ class TestFileWriterBackup:
     def test_backup_returns_path(self, writer, tmp_path):
         """Test that backup returns the path to backup file."""
         original = tmp_path / "test.py"
-        original.write_text("content")
+        original.write_bytes(b"content")
 
         result = writer.backup(original)
 
@@ -234,15 +295,15 @@ class TestFileWriterBackup:
     def test_backup_overwrites_existing(self, writer, tmp_path):
         """Test that backup overwrites existing backup."""
         original = tmp_path / "test.py"
-        original.write_text("new content")
+        original.write_bytes(b"new content")
 
         # Create old backup
         old_backup = tmp_path / "test.py.backup"
-        old_backup.write_text("old backup")
+        old_backup.write_bytes(b"old backup")
 
         backup_path = writer.backup(original)
 
-        assert backup_path.read_text() == "new content"
+        assert backup_path.read_bytes() == b"new content"
 
     def test_backup_with_unicode(self, writer, tmp_path):
         """Test backup preserves unicode content."""
@@ -264,74 +325,113 @@ class TestFileWriterBackup:
 
         assert backup_path.read_bytes() == b"content\x00\x01\x02"
 
+    def test_backup_falls_back_without_copy_file_range(self, writer, tmp_path, monkeypatch):
+        """Test backup still copies when in-kernel copying is unsupported."""
+        original = tmp_path / "test.py"
+        original.write_bytes(b"content\x00\x01\x02")
+
+        def unsupported(*args):
+            raise OSError(errno.EXDEV, "Cross-device link")
+
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        backup_path = writer.backup(original)
+
+        assert backup_path.read_bytes() == b"content\x00\x01\x02"
+
+    def test_backup_read_write_fallback(self, writer, tmp_path, monkeypatch):
+        """Test backup copies through read/write when no in-kernel copy is usable."""
+        original = tmp_path / "test.py"
+        original.write_bytes(b"x" * 3000)
+        backup_path = tmp_path / "test.py.backup"
+        backup_path.write_bytes(b"y" * 5000)  # Longer stale backup must be truncated
+
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        monkeypatch.setattr("docugen.core.file_writer._USE_SENDFILE", False)
+        monkeypatch.setattr("docugen.core.file_writer._COPY_CHUNK", 1024)
+
+        assert writer.backup(original).read_bytes() == b"x" * 3000
+
+    @pytest.mark.parametrize("copy_file_range", [True, False], ids=["copy_range", "fallback"])
+    def test_backup_durable_syncs(self, writer, tmp_path, monkeypatch, copy_file_range):
+        """Test durable backups are flushed to disk before returning."""
+        original = tmp_path / "test.py"
+        original.write_bytes(b"content")
+        synced = []
+        monkeypatch.setattr(os, "fdatasync", lambda fd: synced.append(fd), raising=False)
+        if not copy_file_range:
+            monkeypatch.delattr(os, "copy_file_range", raising=False)
+
+        backup_path = writer.backup(original, durable=True)
+
+        assert backup_path.read_bytes() == b"content"
+        assert len(synced) == 1
+
     def test_backup_empty_file(self, writer, tmp_path):
         """Test backup of empty file."""
         original = tmp_path / "test.py"
-        original.write_text("")
+        original.write_bytes(b"")
 
         backup_path = writer.backup(original)
 
         assert backup_path.exists()
-        assert backup_path.read_text() == ""
+        assert backup_path.read_bytes() == b""
 
     def test_backup_multiple_files(self, writer, tmp_path):
         """Test backing up multiple files."""
         file1 = tmp_path / "test1.py"
         file2 = tmp_path / "test2.py"
-        file1.write_text("content1")
-        file2.write_text("content2")
+        file1.write_bytes(b"content1")
+        file2.write_bytes(b"content2")
 
         backup1 = writer.backup(file1)
         backup2 = writer.backup(file2)
 
         assert backup1.name == "test1.py.backup"
         assert backup2.name == "test2.py.backup"
-        assert backup1.read_text() == "content1"
-        assert backup2.read_text() == "content2"
+        assert backup1.read_bytes() == b"content1"
+        assert backup2.read_bytes() == b"content2"
 
     def test_backup_file_in_subdirectory(self, writer, tmp_path):
         """Test backup of file in subdirectory."""
         subdir = tmp_path / "subdir"
         subdir.mkdir()
         original = subdir / "test.py"
-        original.write_text("content")
+        original.write_bytes(b"content")
 
         backup_path = writer.backup(original)
 
         assert backup_path.parent == subdir
         assert backup_path.name == "test.py.backup"
 
-    def test_backup_different_file_types(self, writer, tmp_path):
+    @pytest.mark.parametrize("name", ["script.py", "query.sql", "analysis.r"])
+    def test_backup_different_file_types(self, writer, tmp_path, name):
         """Test backup of different file types."""
-        py_file = tmp_path / "script.py"
-        sql_file = tmp_path / "query.sql"
-        r_file = tmp_path / "analysis.r"
-
-        py_file.write_text("python")
-        sql_file.write_text("sql")
-        r_file.write_text("r")
+        original = tmp_path / name
+        original.write_bytes(b"content")
 
-        py_backup = writer.backup(py_file)
-        sql_backup = writer.backup(sql_file)
-        r_backup = writer.backup(r_file)
+        backup_path = writer.backup(original)
 
-        assert py_backup.name == "script.py.backup"
-        assert sql_backup.name == "query.sql.backup"
-        assert r_backup.name == "analysis.r.backup"
+        assert backup_path.name == f"{name}.backup"
 
 
 class TestFileWriterCrossPlatform:
     """Test suite for cross-platform compatibility."""
 
-    @pytest.fixture
-    def writer(self):
-        """Create a FileWriter instance."""
-        return FileWriter()
+    @pytest.mark.parametrize("path_str", [
+        "test.py", "dir/query.sql", "dir/archive.tar.r", "dir/.hidden", "dir/file.", "dir/x..py"
+    ])
+    def test_split_path_matches_pathlib(self, path_str):
+        """Test string-based path splitting agrees with pathlib naming."""
+        parent, stem, ext = _split_path(path_str)
+        path = Path(path_str)
+
+        assert (stem, ext) == (path.stem, path.suffix)
+        assert Path(parent or ".") == path.parent
 
     def test_write_with_pathlib_path(self, writer, tmp_path):
         """Test write works with pathlib Path objects."""
         original = Path(tmp_path) / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "modified", "_new")
 
@@ -341,7 +441,7 @@ class TestFileWriterCrossPlatform:
     def test_backup_with_pathlib_path(self, writer, tmp_path):
         """Test backup works with pathlib Path objects."""
         original = Path(tmp_path) / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         backup_path = writer.backup(original)
 
@@ -351,7 +451,7 @@ class TestFileWriterCrossPlatform:
     def test_write_preserves_utf8_encoding(self, writer, tmp_path):
         """Test that write uses UTF-8 encoding."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         content = "# -���\ndef func():\n    '''$C=:F8O'''\n    pass"
         new_path = writer.write(original, content, "_utf8")
@@ -366,12 +466,12 @@ class TestFileWriterCrossPlatform:
         deep_dir.mkdir(parents=True)
 
         original = deep_dir / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "modified", "_new")
 
         assert new_path.exists()
-        assert new_path.read_text() == "modified"
+        assert new_path.read_bytes() == b"modified"
 
     def test_write_with_spaces_in_path(self, writer, tmp_path):
         """Test write handles paths with spaces."""
@@ -379,7 +479,7 @@ class TestFileWriterCrossPlatform:
         subdir.mkdir()
 
         original = subdir / "test file.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "modified", "_new")
 
@@ -390,7 +490,7 @@ class TestFileWriterCrossPlatform:
         """Test write handles filenames with special characters."""
         # Use safe special characters that work on all platforms
         original = tmp_path / "test-file_v1.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "modified", "_new")
 
@@ -401,11 +501,6 @@ class TestFileWriterCrossPlatform:
 class TestFileWriterErrorHandling:
     """Test suite for error handling."""
 
-    @pytest.fixture
-    def writer(self):
-        """Create a FileWriter instance."""
-        return FileWriter()
-
     def test_write_to_readonly_directory(self, writer, tmp_path):
         """Test write to read-only directory raises error."""
         import os
@@ -416,7 +511,7 @@ class TestFileWriterErrorHandling:
             pytest.skip("Permission test not applicable on Windows")
 
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         # Make directory read-only
         os.chmod(tmp_path, 0o444)
@@ -446,21 +541,16 @@ class TestFileWriterErrorHandling:
 
         # Should still create the new file
         assert new_path.exists()
-        assert new_path.read_text() == "content"
+        assert new_path.read_bytes() == b"content"
 
 
 class TestFileWriterIntegration:
     """Integration tests for file writer."""
 
-    @pytest.fixture
-    def writer(self):
-        """Create a FileWriter instance."""
-        return FileWriter()
-
     def test_backup_then_write(self, writer, tmp_path):
         """Test backing up then writing modified file."""
         original = tmp_path / "test.py"
-        original.write_text("original content")
+        original.write_bytes(b"original content")
 
         # Backup first
         backup_path = writer.backup(original)
@@ -468,30 +558,46 @@ class TestFileWriterIntegration:
         # Then modify and write
         new_path = writer.write(original, "modified content", "_modified")
 
-        assert backup_path.read_text() == "original content"
-        assert new_path.read_text() == "modified content"
-        assert original.read_text() == "original content"  # Original unchanged
+        assert backup_path.read_bytes() == b"original content"
+        assert new_path.read_bytes() == b"modified content"
+        assert original.read_bytes() == b"original content"  # Original unchanged
+
+    @pytest.mark.parametrize("suffix, backed_up", [("_documented", False), ("", True)])
+    def test_safe_modify_backs_up_only_on_overwrite(self, writer, tmp_path, suffix, backed_up):
+        """Test safe_modify only backs up the original when writing over it."""
+        original = tmp_path / "test.py"
+        original.write_bytes(b"original content")
+
+        new_path = writer.safe_modify(original, "modified content", suffix)
+
+        assert new_path.read_bytes() == b"modified content"
+        backup = tmp_path / "test.py.backup"
+        assert backup.exists() is backed_up
+        if backed_up:
+            assert backup.read_bytes() == b"original content"
+        else:
+            assert original.read_bytes() == b"original content"
 
     def test_multiple_write_operations(self, writer, tmp_path):
         """Test multiple write operations on same file."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         path1 = writer.write(original, "version1", "_v1")
         path2 = writer.write(original, "version2", "_v2")
         path3 = writer.write(original, "version3", "_v3")
 
-        assert path1.read_text() == "version1"
-        assert path2.read_text() == "version2"
-        assert path3.read_text() == "version3"
+        assert path1.read_bytes() == b"version1"
+        assert path2.read_bytes() == b"version2"
+        assert path3.read_bytes() == b"version3"
 
     def test_write_then_backup_new_file(self, writer, tmp_path):
         """Test writing new file then backing it up."""
         original = tmp_path / "test.py"
-        original.write_text("original")
+        original.write_bytes(b"original")
 
         new_path = writer.write(original, "modified", "_new")
         backup_of_new = writer.backup(new_path)
 
-        assert backup_of_new.read_text() == "modified"
+        assert backup_of_new.read_bytes() == b"modified"
         assert backup_of_new.name == "test_new.py.backup"
\ No newline at end of file
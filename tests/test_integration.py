@@ -4,88 +4,107 @@ Integration tests for end-to-end DocuGen pipeline.
 These tests verify that all components work together correctly.
 """
 
+import os
+
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch
-from docugen.core.doc_parser import DocParser
-from docugen.core.doc_validator import DocValidator
+from unittest.mock import Mock
 from docugen.core.doc_generator import DocGenerator
-from docugen.core.file_writer import FileWriter
 
 
-class TestParserValidatorIntegration:
-    """Test integration between parser and validator."""
+# Select with -m integration; every test works under its own tmp_path and a
+# mocked client, so the module can run with pytest -n auto --dist loadscope
+pytestmark = pytest.mark.integration
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
 
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
+@pytest.fixture
+def generator():
+    """Create a DocGenerator instance with a fresh mocked client."""
+    # Anthropic itself is patched once per session in conftest.py
+    gen = DocGenerator(api_key="test-key")
+    gen.client = Mock()
+    return gen
 
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Get path to fixtures directory."""
-        return Path(__file__).parent / "fixtures"
 
-    def test_parse_and_validate_documented_python(self, parser, validator, fixtures_dir):
-        """Test parsing and validating documented Python file."""
-        file_path = fixtures_dir / "python_documented.py"
+def _response(text):
+    """Build a mocked API response whose single content block holds text."""
+    return Mock(content=[Mock(text=text)])
 
-        # Parse the file
-        doc = parser.parse(file_path)
-        assert doc is not None
 
-        # Validate the parsed documentation
-        result = validator.validate(file_path, doc)
-        assert result.is_valid is True
+@pytest.fixture
+def mock_api(generator):
+    """Return a helper that makes the mocked API answer with the given text."""
+    def _set(text):
+        response = _response(text)
+        generator.client.messages.create = Mock(return_value=response)
+        return response
+    return _set
 
-    def test_parse_and_validate_incomplete_python(self, parser, validator, fixtures_dir):
-        """Test parsing and validating incomplete Python file."""
-        file_path = fixtures_dir / "python_incomplete.py"
 
-        # Parse the file
-        doc = parser.parse(file_path)
-        assert doc is not None
+@pytest.fixture
+def mock_api_side_effect(generator):
+    """Return a helper that routes mocked API calls through a function."""
+    def _set(fn):
+        generator.client.messages.create = Mock(side_effect=fn)
+        return generator.client.messages.create
+    return _set
 
-        # Validate the parsed documentation
-        result = validator.validate(file_path, doc)
-        assert result.is_valid is False
-        assert len(result.issues) > 0
 
-    def test_parse_and_validate_documented_sql(self, parser, validator, fixtures_dir):
-        """Test parsing and validating documented SQL file."""
-        file_path = fixtures_dir / "sql_documented.sql"
+@pytest.fixture(scope="module")
+def corpus_dir(tmp_path_factory):
+    """Build the input files that tests only read, once for the module."""
+    corpus = tmp_path_factory.mktemp("corpus")
 
-        doc = parser.parse(file_path)
-        assert doc is not None
+    # Python file with a syntax error
+    (corpus / "invalid.py").write_text("def broken(\n    incomplete syntax")
 
-        result = validator.validate(file_path, doc)
-        assert result.is_valid is True
+    # Module with many documented functions
+    code_lines = ['"""Module docstring."""\n\n']
+    for i in range(50):
+        code_lines.append(f'def func_{i}():\n')
+        code_lines.append(f'    """Function {i}."""\n')
+        code_lines.append(f'    pass\n\n')
+    (corpus / "large.py").write_text(''.join(code_lines))
+
+    return corpus
 
-    def test_parse_and_validate_documented_r(self, parser, validator, fixtures_dir):
-        """Test parsing and validating documented R file."""
-        file_path = fixtures_dir / "r_documented.r"
 
-        doc = parser.parse(file_path)
+class TestParserValidatorIntegration:
+    """Test integration between parser and validator."""
+
+    @pytest.mark.parametrize("name", [
+        "python_documented.py", "sql_documented.sql", "r_documented.r",
+    ], ids=["python", "sql", "r"])
+    def test_parse_and_validate_documented(self, validator, fixture_files, parsed_fixtures, name):
+        """Test parsing and validating a documented file of each language."""
+        # Parsed once per session
+        doc = parsed_fixtures[name]
         assert doc is not None
 
-        result = validator.validate(file_path, doc)
+        # Validate the parsed documentation
+        result = validator.validate(fixture_files[name], doc)
         assert result.is_valid is True
 
-    def test_parse_and_validate_all_fixtures(self, parser, validator, fixtures_dir):
-        """Test parsing and validating all fixture files."""
-        results = {}
+    @pytest.mark.parametrize("name", [
+        "python_incomplete.py", "sql_incomplete.sql", "r_incomplete.r",
+    ], ids=["python", "sql", "r"])
+    def test_parse_and_validate_incomplete(self, validator, fixture_files, parsed_fixtures, name):
+        """Test parsing and validating an incomplete file of each language."""
+        # Parsed once per session
+        doc = parsed_fixtures[name]
+        assert doc is not None
 
-        for file_path in fixtures_dir.glob("*"):
-            if file_path.suffix in ['.py', '.sql', '.r']:
-                doc = parser.parse(file_path)
-                if doc is not None:
-                    validation = validator.validate(file_path, doc)
-                    results[file_path.name] = validation.is_valid
+        # Validate the parsed documentation
+        result = validator.validate(fixture_files[name], doc)
+        assert result.is_valid is False
+        assert len(result.issues) > 0
+
+    def test_parse_and_validate_all_fixtures(self, validator, fixture_files, parsed_fixtures):
+        """Test parsing and validating all fixture files."""
+        results = {
+            name: validator.validate(fixture_files[name], doc).is_valid
+            for name, doc in parsed_fixtures.items()
+            if doc is not None
+        }
 
         # Check that documented files are valid
         assert results.get('python_documented.py') is True
@@ -102,81 +121,55 @@ class TestGeneratorWriterIntegration:
     """Test integration between generator and file writer."""
 
     @pytest.fixture
-    def generator(self):
-        """Create a DocGenerator instance with mocked API."""
-        with patch('docugen.core.doc_generator.Anthropic') as mock_anthropic:
-            mock_client = Mock()
-            mock_anthropic.return_value = mock_client
-            gen = DocGenerator(api_key="test-key")
-            gen.client = mock_client
-            return gen
-
-    @pytest.fixture
-    def writer(self):
-        """Create a FileWriter instance."""
-        return FileWriter()
-
-    def test_generate_and_write_python(self, generator, writer, tmp_path):
-        """Test generating and writing Python documentation."""
-        # Mock API response
-        mock_response = Mock()
-        mock_content = Mock()
-        mock_content.text = '"""\nGenerated documentation.\n\nParameters\n----------\nx : int\n\nReturns\n-------\nint\n"""'
-        mock_response.content = [mock_content]
-        generator.client.messages.create = Mock(return_value=mock_response)
-
+    def canned_response(self, request, generator, cassettes):
+        """Answer API calls with the recorded response named by the parameter."""
+        response = cassettes[request.param]
+        generator.client.messages.create = Mock(return_value=response)
+        return response
+
+    @pytest.mark.parametrize("canned_response, filename, code, expected", [
+        (
+            "generate_python_success",
+            "test.py",
+            "def test(x):\n    return x",
+            ("Parameters", "Returns", "def test(x):"),
+        ),
+        (
+            "generate_sql_success",
+            "query.sql",
+            "SELECT * FROM users;",
+            ("-- #", "SELECT * FROM users;"),
+        ),
+        (
+            "generate_r_success",
+            "func.r",
+            "test <- function(x) { return(x) }",
+            ("#' @param x", "test <- function(x)"),
+        ),
+    ], ids=["python", "sql", "r"], indirect=["canned_response"])
+    def test_generate_and_write(self, generator, canned_response, writer, tmp_path,
+                                filename, code, expected):
+        """Test generating and writing documentation for each language."""
         # Create original file
-        original = tmp_path / "test.py"
-        code = "def test(x):\n    return x"
+        original = tmp_path / filename
         original.write_text(code)
 
-        # Generate documentation
+        # Generate documentation and place it above the code
         docs = generator.generate(original, code)
-
-        # Add docs to code
-        documented_code = f"{docs}\ndef test(x):\n    return x"
+        documented_code = f"{docs}\n\n{code}"
 
         # Write documented version
         new_path = writer.write(original, documented_code, "_documented")
 
         # Verify
         assert new_path.exists()
-        assert "Parameters" in new_path.read_text()
-        assert "Returns" in new_path.read_text()
-        assert "def test(x):" in new_path.read_text()
+        content = new_path.read_text()
+        assert all(part in content for part in expected)
 
-    def test_generate_and_write_sql(self, generator, writer, tmp_path):
-        """Test generating and writing SQL documentation."""
-        # Mock API response
-        mock_response = Mock()
-        mock_content = Mock()
-        mock_content.text = '-- # Test Query\n-- ## Description\n-- Test description\n-- ## Parameters\n-- - None\n-- ## Returns\n-- - result (INT)\n-- ## Example\n-- SELECT 1;'
-        mock_response.content = [mock_content]
-        generator.client.messages.create = Mock(return_value=mock_response)
-
-        # Create original file
-        original = tmp_path / "query.sql"
-        code = "SELECT * FROM users;"
-        original.write_text(code)
-
-        # Generate and write
-        docs = generator.generate(original, code)
-        documented_code = f"{docs}\n\n{code}"
-        new_path = writer.write(original, documented_code, "_documented")
-
-        # Verify
-        assert new_path.exists()
-        assert "-- #" in new_path.read_text()
-        assert "SELECT * FROM users;" in new_path.read_text()
-
-    def test_backup_generate_and_write(self, generator, writer, tmp_path):
+    def test_backup_generate_and_write(self, generator, mock_api, writer, tmp_path):
         """Test backup, generate, and write workflow."""
         # Mock API response
-        mock_response = Mock()
-        mock_content = Mock()
-        mock_content.text = '"""\nGenerated docs.\n\nReturns\n-------\nNone\n"""'
-        mock_response.content = [mock_content]
-        generator.client.messages.create = Mock(return_value=mock_response)
+        mock_api('"""\nGenerated docs.\n\nReturns\n-------\nNone\n"""')
 
         # Create original file
         original = tmp_path / "script.py"
@@ -204,39 +197,10 @@ class TestGeneratorWriterIntegration:
 class TestFullPipelineIntegration:
     """Test complete end-to-end pipeline."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
-
-    @pytest.fixture
-    def generator(self):
-        """Create a DocGenerator instance with mocked API."""
-        with patch('docugen.core.doc_generator.Anthropic') as mock_anthropic:
-            mock_client = Mock()
-            mock_anthropic.return_value = mock_client
-            gen = DocGenerator(api_key="test-key")
-            gen.client = mock_client
-            return gen
-
-    @pytest.fixture
-    def writer(self):
-        """Create a FileWriter instance."""
-        return FileWriter()
-
-    def test_undocumented_to_documented_python(self, parser, validator, generator, writer, tmp_path):
+    def test_undocumented_to_documented_python(self, parser, validator, generator, mock_api, writer, tmp_path):
         """Test complete pipeline: undocumented -> documented Python file."""
         # Mock API response
-        mock_response = Mock()
-        mock_content = Mock()
-        mock_content.text = '"""\nCalculate sum.\n\nParameters\n----------\na : int\n    First number\nb : int\n    Second number\n\nReturns\n-------\nint\n    Sum of a and b\n"""'
-        mock_response.content = [mock_content]
-        generator.client.messages.create = Mock(return_value=mock_response)
+        mock_api('"""\nCalculate sum.\n\nParameters\n----------\na : int\n    First number\nb : int\n    Second number\n\nReturns\n-------\nint\n    Sum of a and b\n"""')
 
         # Create undocumented file
         original = tmp_path / "calc.py"
@@ -264,7 +228,7 @@ class TestFullPipelineIntegration:
         # Note: Validation may or may not pass depending on generated docs quality
         # The key is that documentation was successfully generated and inserted
 
-    def test_incomplete_to_complete_documentation(self, parser, validator, generator, writer, tmp_path):
+    def test_incomplete_to_complete_documentation(self, parser, validator, generator, mock_api, writer, tmp_path):
         """Test complete pipeline: incomplete -> complete documentation."""
         # Create file with incomplete docs
         original = tmp_path / "func.py"
@@ -274,11 +238,7 @@ class TestFullPipelineIntegration:
         original.write_text(code)
 
         # Mock API response
-        mock_response = Mock()
-        mock_content = Mock()
-        mock_content.text = '"""\nProcess input data.\n\nParameters\n----------\ndata : list\n    Input data to process\n\nReturns\n-------\nlist\n    Processed data\n\nExamples\n--------\n>>> process([1, 2, 3])\n[1, 2, 3]\n"""'
-        mock_response.content = [mock_content]
-        generator.client.messages.create = Mock(return_value=mock_response)
+        mock_api('"""\nProcess input data.\n\nParameters\n----------\ndata : list\n    Input data to process\n\nReturns\n-------\nlist\n    Processed data\n\nExamples\n--------\n>>> process([1, 2, 3])\n[1, 2, 3]\n"""')
 
         # Step 1: Parse existing docs
         doc = parser.parse(original)
@@ -300,25 +260,20 @@ class TestFullPipelineIntegration:
         assert new_doc is not None
         # Documentation was successfully updated and inserted
 
-    def test_multiple_files_pipeline(self, parser, validator, generator, writer, tmp_path):
+    def test_multiple_files_pipeline(self, parser, validator, generator, mock_api_side_effect, writer, tmp_path):
         """Test pipeline with multiple files of different types."""
         # Mock API to return appropriate docs for each language
         def mock_generate(model, max_tokens, temperature, messages):
-            prompt = messages[0]['content']
-            response = Mock()
-            content = Mock()
+            prompt = "".join(block['text'] for block in messages[0]['content'])
 
             if 'def' in prompt:  # Python
-                content.text = '"""\nPython function.\n\nReturns\n-------\nNone\n"""'
+                return _response('"""\nPython function.\n\nReturns\n-------\nNone\n"""')
             elif 'SELECT' in prompt:  # SQL
-                content.text = '-- # SQL Query\n-- ## Description\n-- Query description\n-- ## Parameters\n-- - None\n-- ## Returns\n-- - result (INT)\n-- ## Example\n-- SELECT 1;'
+                return _response('-- # SQL Query\n-- ## Description\n-- Query description\n-- ## Parameters\n-- - None\n-- ## Returns\n-- - result (INT)\n-- ## Example\n-- SELECT 1;')
             else:  # R
-                content.text = "#' R function\n#' @return Result\n#' @export"
-
-            response.content = [content]
-            return response
+                return _response("#' R function\n#' @return Result\n#' @export")
 
-        generator.client.messages.create = Mock(side_effect=mock_generate)
+        mock_api_side_effect(mock_generate)
 
         # Create multiple files
         py_file = tmp_path / "script.py"
@@ -368,31 +323,9 @@ class TestFullPipelineIntegration:
 class TestErrorHandlingIntegration:
     """Test error handling across components."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
-
-    @pytest.fixture
-    def generator(self):
-        """Create a DocGenerator instance with mocked API."""
-        with patch('docugen.core.doc_generator.Anthropic') as mock_anthropic:
-            mock_client = Mock()
-            mock_anthropic.return_value = mock_client
-            gen = DocGenerator(api_key="test-key")
-            gen.client = mock_client
-            return gen
-
-    def test_handle_unparseable_file(self, parser, validator, tmp_path):
+    def test_handle_unparseable_file(self, parser, validator, corpus_dir):
         """Test handling file that can't be parsed."""
-        # Create invalid Python file
-        invalid_file = tmp_path / "invalid.py"
-        invalid_file.write_text("def broken(\n    incomplete syntax")
+        invalid_file = corpus_dir / "invalid.py"
 
         # Parse should return None
         doc = parser.parse(invalid_file)
@@ -405,10 +338,11 @@ class TestErrorHandlingIntegration:
 
     def test_handle_api_error_gracefully(self, parser, generator, tmp_path):
         """Test handling API errors gracefully."""
-        # Mock API to raise error
-        APIError = type('APIError', (Exception,), {})
-        mock_error = APIError("API Error")
-        generator.client.messages.create = Mock(side_effect=mock_error)
+        # Make the API raise; no call inspection is needed, so a plain function will do
+        def _raise(*args, **kwargs):
+            raise RuntimeError("API Error")
+
+        generator.client.messages.create = _raise
 
         original = tmp_path / "test.py"
         code = "def func(): pass"
@@ -420,9 +354,9 @@ class TestErrorHandlingIntegration:
 
         assert "error" in str(exc_info.value).lower()
 
-    def test_handle_nonexistent_file(self, parser, validator, tmp_path):
+    def test_handle_nonexistent_file(self, parser, validator, corpus_dir):
         """Test handling nonexistent file."""
-        nonexistent = tmp_path / "does_not_exist.py"
+        nonexistent = corpus_dir / "does_not_exist.py"
 
         # Parser should handle gracefully
         doc = parser.parse(nonexistent)
@@ -436,16 +370,6 @@ class TestErrorHandlingIntegration:
 class TestCrossPlatformIntegration:
     """Test cross-platform compatibility of integrated pipeline."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    @pytest.fixture
-    def writer(self):
-        """Create a FileWriter instance."""
-        return FileWriter()
-
     def test_pipeline_with_unicode_content(self, parser, writer, tmp_path):
         """Test pipeline with unicode content."""
         # Create file with unicode
@@ -509,44 +433,39 @@ class TestCrossPlatformIntegration:
 class TestPerformanceIntegration:
     """Test performance characteristics of integrated pipeline."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a DocParser instance."""
-        return DocParser()
-
-    @pytest.fixture
-    def validator(self):
-        """Create a DocValidator instance."""
-        return DocValidator()
-
-    def test_parse_validate_many_files(self, parser, validator, tmp_path):
+    @pytest.fixture(scope="module", params=[10, 100, 1000])
+    def many_files(self, request, tmp_path_factory):
+        """Build a directory of N small Python files once per N for the module."""
+        count = request.param
+        root = tmp_path_factory.mktemp(f"many_{count}")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        for i in range(count):
+            fd = os.open(root / f"test_{i}.py", flags, 0o644)
+            try:
+                os.write(fd, f"def func_{i}():\n    pass".encode())
+            finally:
+                os.close(fd)
+        return root, count
+
+    @pytest.mark.slow
+    def test_parse_validate_many_files(self, parser, validator, many_files):
         """Test parsing and validating multiple files efficiently."""
-        # Create multiple test files
-        for i in range(10):
-            test_file = tmp_path / f"test_{i}.py"
-            test_file.write_text(f"def func_{i}():\n    pass")
+        root, count = many_files
 
         # Process all files
         results = []
-        for file_path in tmp_path.glob("*.py"):
+        for file_path in root.glob("*.py"):
             doc = parser.parse(file_path)
             validation = validator.validate(file_path, doc)
             results.append((file_path.name, validation.is_valid))
 
         # All should be processed
-        assert len(results) == 10
+        assert len(results) == count
 
-    def test_parse_large_file(self, parser, tmp_path):
+    @pytest.mark.slow
+    def test_parse_large_file(self, parser, corpus_dir):
         """Test parsing large file."""
-        # Create file with many functions
-        code_lines = ['"""Module docstring."""\n\n']
-        for i in range(50):
-            code_lines.append(f'def func_{i}():\n')
-            code_lines.append(f'    """Function {i}."""\n')
-            code_lines.append(f'    pass\n\n')
-
-        large_file = tmp_path / "large.py"
-        large_file.write_text(''.join(code_lines))
+        large_file = corpus_dir / "large.py"
 
         # Should parse successfully
         doc = parser.parse(large_file)
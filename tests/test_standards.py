@@ -0,0 +1,131 @@
+"""
+Tests for documentation standard templates.
+"""
+
+import pytest
+from docugen.standards.python_standard import PythonStandard
+from docugen.standards.r_standard import RStandard
+from docugen.standards.sql_standard import SQLStandard
+from docugen.standards.template import compile_template, render_template
+
+
+class TestTemplateRendering:
+    """Test suite for precompiled template rendering."""
+
+    def test_compile_template_splits_fields(self):
+        """Test compiling a template into literals and field names."""
+        literals, fields = compile_template("-- # {name}\n-- {description}\n")
+
+        assert fields == ('name', 'description')
+        assert literals == ('-- # ', '\n-- ', '\n')
+
+    def test_render_template_missing_field(self):
+        """Test rendering fails when a field has no value."""
+        with pytest.raises(KeyError):
+            render_template(compile_template("{title}"), {})
+
+    def test_render_matches_format_r(self):
+        """Test R render output matches str.format on the template."""
+        fields = {
+            'title': 'Calculate Mean',
+            'description': 'Calculates the arithmetic mean.',
+            'param_name': 'x',
+            'param_description': 'A numeric vector',
+            'return_description': 'The mean of x',
+            'examples': 'calc_mean(1:10)'
+        }
+        assert RStandard.render(**fields) == RStandard.get_template().format(**fields)
+
+    def test_render_matches_format_sql(self):
+        """Test SQL render output matches str.format on the template."""
+        fields = {
+            'function_name': 'Get Users',
+            'description': 'Returns all users.',
+            'parameters': '- None',
+            'returns': '- id (INT)',
+            'example': 'SELECT * FROM users;'
+        }
+        assert SQLStandard.render(**fields) == SQLStandard.get_template().format(**fields)
+
+    def test_render_matches_format_python(self):
+        """Test Python render output matches str.format on the template."""
+        fields = {
+            'short_description': 'Add numbers.',
+            'long_description': 'Adds two numbers together.',
+            'parameters': 'a : int\nb : int',
+            'returns': 'int',
+            'examples': '>>> add(1, 2)\n3'
+        }
+        assert PythonStandard.render(**fields) == PythonStandard.get_template().format(**fields)
+
+
+class TestRStandardMarkers:
+    """Test suite for Roxygen2 line marker detection."""
+
+    def test_find_unmarked_line_reports_line_number(self):
+        """Test the first unmarked line is reported with its 1-based number."""
+        doc = "#' Title\n\n  #' @param x A value\n@return Result\n#' @export"
+        assert RStandard.find_unmarked_line(doc) == 4
+
+    def test_find_unmarked_line_all_marked(self):
+        """Test fully marked docs (including blank and CRLF lines) pass."""
+        doc = "#' Title\r\n\r\n#' @param x A value\r\n#' @return Result\r\n"
+        assert RStandard.find_unmarked_line(doc) is None
+        assert RStandard.validate_structure(doc) is True
+
+
+class TestBytesValidation:
+    """Test suite for validating undecoded documentation."""
+
+    R_DOC = "#' Title\n#'\n#' @param x A value\n#' @return Result\n"
+    SQL_DOC = ("-- # Query\n-- ## Description\n-- Text\n-- ## Parameters\n-- - None\n"
+               "-- ## Returns\n-- - id (INT)\n-- ## Example\n-- SELECT 1;\n")
+
+    @pytest.mark.parametrize("convert", [bytes, bytearray, memoryview])
+    def test_r_bytes_matches_str(self, convert):
+        """Test R validation gives the same result for bytes-like input."""
+        valid = convert(self.R_DOC.encode())
+        invalid = convert((self.R_DOC + "x <- 1\n").encode())
+
+        assert RStandard.validate_structure(valid) is True
+        assert RStandard.validate_structure(invalid) is False
+        assert RStandard.find_unmarked_line(invalid) == 5
+
+    @pytest.mark.parametrize("convert", [bytes, bytearray, memoryview])
+    def test_sql_bytes_matches_str(self, convert):
+        """Test SQL validation gives the same result for bytes-like input."""
+        valid = convert(self.SQL_DOC.upper().encode())
+        invalid = convert(self.SQL_DOC.replace("## Returns", "## Output").encode())
+
+        assert SQLStandard.validate_structure(valid) is True
+        assert SQLStandard.validate_structure(invalid) is False
+
+    @pytest.mark.parametrize("doc", [
+        "#' Title\n\u00a0#' @param x A value\n#' @return Result\n",
+        "#' Café au lait\n#' @param x Größe\n#' @return Résumé\n",
+        "#' Title\n\u00a0x <- 1\n#' @param x A value\n#' @return Result\n",
+        "#' Title\n#' @param x A value\n\u2003\n#' @return Result\n",
+    ], ids=["nbsp_indent", "accents", "nbsp_unmarked", "em_space_blank"])
+    @pytest.mark.parametrize("convert", [bytes, bytearray, memoryview])
+    def test_r_non_ascii_bytes_matches_str(self, convert, doc):
+        """Test R validation of non-ASCII UTF-8 bytes matches the str result."""
+        data = convert(doc.encode())
+
+        assert RStandard.validate_structure(data) is RStandard.validate_structure(doc)
+        assert RStandard.find_unmarked_line(data) == RStandard.find_unmarked_line(doc)
+
+    def test_r_nbsp_indent_is_marked(self):
+        """Test a #' line indented with a no-break space counts as marked."""
+        doc = "#' Title\n\u00a0#' @param x A value\n#' @return Result\n"
+
+        assert RStandard.validate_structure(doc.encode()) is True
+        assert RStandard.find_unmarked_line(doc.encode()) is None
+
+    @pytest.mark.parametrize("convert", [bytes, bytearray, memoryview])
+    def test_sql_non_ascii_bytes_matches_str(self, convert):
+        """Test SQL validation of non-ASCII UTF-8 bytes matches the str result."""
+        doc = self.SQL_DOC.replace("-- Text", "-- Café Größe\u00a0résumé")
+        invalid = doc.replace("## Example", "## Beispiel über")
+
+        assert SQLStandard.validate_structure(convert(doc.encode())) is SQLStandard.validate_structure(doc)
+        assert SQLStandard.validate_structure(convert(invalid.encode())) is SQLStandard.validate_structure(invalid)